@@ -17,19 +17,101 @@
 # =============================================================================
 
 # 导入必要的库
+import importlib.util  # 用于启动时检查依赖是否已安装
+import sys  # 用于缺少依赖时退出
+
+# 缺少psutil时直接给出安装提示并退出，不在运行时自动调用pip安装
+if importlib.util.find_spec('psutil') is None:
+    sys.exit("缺少依赖 psutil，请先执行: pip install psutil")
+
 import psutil  # 用于获取系统和进程信息
 import time  # 用于时间相关操作
 import logging  # 用于日志记录
+import logging.handlers  # 用于日志轮转和后台队列写日志
+import atexit  # 用于程序退出时停止日志队列监听线程
 import os  # 用于文件和目录操作
-import json  # 用于配置文件处理
+import copy  # 用于复制缓存的配置，避免多个实例共享同一份嵌套字典
+try:
+    import orjson as _json  # 可选依赖：解析速度比标准库json快数倍
+except ImportError:
+    import json as _json  # 未安装orjson时退回标准库（两者的loads都接受bytes）
 import threading  # 用于多线程支持
+import queue  # 用于向导出线程传递数据快照
 import csv  # 用于数据导出
+import functools  # 用于预先绑定声音播放命令的参数
 from datetime import datetime, timedelta  # 用于时间戳和日期计算
-from typing import Optional, Dict, Any, List, Tuple  # 类型提示
+from typing import Optional, Dict, Any, List, Tuple, Callable  # 类型提示
 from collections import deque  # 用于高效的数据历史记录
 import platform  # 用于获取平台信息
 import subprocess  # 用于执行系统命令
 import signal  # 用于信号处理
+import statistics  # 用于计算监控摘要中的分位数
+from operator import itemgetter  # 用于按字段位置批量取值
+import socket  # 用于识别IPv4地址族（socket.AF_INET）
+
+# 字节单位表及对应的换算基数（第 i 级单位 = 1024 ** i 字节）
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+_SPEED_UNITS = ('B/s', 'KB/s', 'MB/s', 'GB/s')
+_UNIT_SCALES = tuple(1 << (10 * i) for i in range(len(_BYTE_UNITS)))
+
+# 1GB 对应的字节数（内存、磁盘容量换算成GB时使用）
+_GIB = 1 << 30
+
+# Linux下内存和网络计数直接读取的 /proc 文件（其他平台或读取失败时使用psutil）
+_PROC_MEMINFO = '/proc/meminfo'
+_PROC_NET_DEV = '/proc/net/dev'
+
+
+def _parse_meminfo(data: bytes) -> Dict[bytes, int]:
+    """
+    解析 /proc/meminfo 的内容
+
+    Args:
+        data (bytes): 文件内容，每行形如 b'MemTotal:  16302112 kB'
+
+    Returns:
+        Dict[bytes, int]: 字段名到字节数的映射（文件中的数值单位为kB）
+    """
+    fields = {}
+    for line in data.splitlines():
+        parts = line.split()
+        if len(parts) >= 2:
+            fields[parts[0].rstrip(b':')] = int(parts[1]) * 1024
+    return fields
+
+
+def _parse_net_dev(data: bytes) -> Tuple[int, int]:
+    """
+    解析 /proc/net/dev 的内容，汇总所有网络接口的收发字节数
+
+    与 psutil.net_io_counters() 一样统计全部接口（包括回环接口）。
+
+    Args:
+        data (bytes): 文件内容，前两行是表头，之后每行形如 b'eth0: 接收8列 发送8列'
+
+    Returns:
+        Tuple[int, int]: (累计发送字节数, 累计接收字节数)
+    """
+    sent = recv = 0
+    for line in data.splitlines()[2:]:
+        # 数值很大时接口名和第一列之间没有空格，因此先按冒号切开
+        _, _, counters = line.partition(b':')
+        values = counters.split()
+        recv += int(values[0])  # 接收字节数
+        sent += int(values[8])  # 发送字节数
+    return sent, recv
+
+
+# 已解析的配置文件缓存：键为 (绝对路径, 修改时间纳秒)，文件未改动时重复创建实例无需再次解析
+_CONFIG_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+# 历史记录中每条数据的字段顺序（每条数据是一个元组，timestamp 为 time.time() 浮点时间戳）
+CPU_FIELDS = ('timestamp', 'cpu_percent', 'core_count', 'per_cpu')
+MEMORY_FIELDS = ('timestamp', 'memory_percent', 'used_gb', 'total_gb',
+                 'swap_percent', 'swap_used_gb', 'swap_total_gb')
+NETWORK_FIELDS = ('timestamp', 'upload_speed', 'download_speed',
+                  'total_sent', 'total_recv', 'active_interfaces')
+DISK_FIELDS = ('timestamp', 'device', 'mountpoint', 'disk_percent', 'used_gb', 'total_gb', 'free_gb')
 
 
 class EnhancedSystemMonitor:
@@ -51,6 +133,38 @@ class EnhancedSystemMonitor:
         summary = monitor.get_monitoring_summary()  # 获取监控摘要
     """
 
+    # 磁盘分区列表的刷新周期（秒），用于发现运行期间新挂载的设备
+    PARTITION_REFRESH_SECONDS = 300
+
+    # 两次警报声音之间的最小间隔（秒），不同警报键同时触发时也只响一次
+    SOUND_MIN_INTERVAL = 5
+
+    # 活跃网络接口列表的刷新周期（秒）
+    IFACE_REFRESH_SECONDS = 30
+
+    # 后台写日志的监听线程（同名记录器全局唯一，重新配置日志时先停止旧的）
+    _log_listener = None
+
+    # 监控摘要中各指标参与统计的字段下标（对应 *_FIELDS 中的位置，多个下标表示求和后统计）
+    SUMMARY_COLUMNS = {
+        'cpu': (1,),  # CPU使用率
+        'memory': (1,),  # 内存使用率
+        'network': (1, 2),  # 网络总速度（上传+下载）
+        'disk': (3,),  # 磁盘使用率
+    }
+
+    # 固定实例属性：不再为每个实例创建 __dict__，属性读写直接走槽位描述符
+    __slots__ = (
+        'config_file', 'config', 'logger', 'console_output', '_console_lines',
+        'monitoring', '_stop_event', 'monitor_threads',
+        '_cpu_history', '_mem_history', '_net_history', '_disk_history',
+        '_last_net', '_cpu_count', '_core_prefixes', '_partitions', '_partitions_refreshed_at',
+        '_static_info', '_active_ifaces', '_ifaces_refreshed_at',
+        'alert_history', '_alert_cooldown', '_last_sound_time', '_sound_fn',
+        '_export_queue', '_export_thread', '_export_files', '_export_last_rows', '_use_proc', '_proc_fds',
+        'start_time', '_start_mono',
+    )
+
     def __init__(self, config_file: str = 'monitor_config.json'):
         """
         初始化增强版系统监控器
@@ -73,26 +187,97 @@ class EnhancedSystemMonitor:
         # 设置日志系统
         self.logger = self._setup_logging()
 
+        # 是否在控制台输出每个监控周期的数据（与控制台日志使用同一个配置项）
+        self.console_output = self.config['enable_console_output']
+
+        # 当前监控周期待输出的控制台行，每个周期结束时一次性写出
+        self._console_lines = []
+
         # 监控状态标志（False表示未开始监控）
         self.monitoring = False
 
+        # 停止事件：各循环用 Event.wait(interval) 代替 time.sleep(interval)，
+        # stop_monitoring 调用 set() 后等待立即返回，无需等满一个监控间隔
+        self._stop_event = threading.Event()
+
         # 监控线程列表（用于多线程监控）
         self.monitor_threads = []
 
         # 数据历史记录（使用deque限制内存使用，最多保存1000个数据点）
-        self.data_history = {
-            'cpu': deque(maxlen=1000),  # CPU监控数据历史
-            'memory': deque(maxlen=1000),  # 内存监控数据历史
-            'network': deque(maxlen=1000),  # 网络监控数据历史
-            'disk': deque(maxlen=1000)  # 磁盘监控数据历史
-        }
-
-        # 警报历史记录（用于实现警报冷却机制）
+        # deque(maxlen) 本身就是C实现的定长环形缓冲区，写满后自动覆盖最旧的数据；
+        # 每条数据存为元组（字段顺序见 CPU_FIELDS 等常量），不再为每个点创建字典和datetime对象；
+        # 每个指标单独一个属性，采样时直接取属性，省去一次字典键查找。
+        # 单写者约定：只有调度线程（_monitor_loop）追加数据、修改警报历史，其他线程只通过
+        # _snapshot_history 读取一次性复制的元组，因此这些结构都不需要加锁
+        self._cpu_history = deque(maxlen=1000)  # CPU监控数据历史
+        self._mem_history = deque(maxlen=1000)  # 内存监控数据历史
+        self._net_history = deque(maxlen=1000)  # 网络监控数据历史
+        self._disk_history = deque(maxlen=1000)  # 磁盘监控数据历史
+
+        # 上一次网络采样的累计字节数和时间戳（用于计算网络速度）
+        self._last_net = None
+
+        # 缓存运行期间几乎不变的信息，避免每个监控周期重复调用psutil
+        self._cpu_count = psutil.cpu_count(logical=True)  # 逻辑核心数
+        self._core_prefixes = [f"核心{i}: " for i in range(self._cpu_count or 0)]  # 各核心输出前缀
+        self._partitions = psutil.disk_partitions(all=False)  # 磁盘分区列表
+        self._partitions_refreshed_at = time.monotonic()  # 分区列表上次刷新时间
+        self._static_info = None  # 平台、Python版本、启动时间等静态信息，首次获取系统信息时填充
+        self._active_ifaces = []  # 活跃的IPv4网络接口（非回环）
+        self._ifaces_refreshed_at = None  # 活跃接口列表上次刷新时间（time.monotonic()）
+
+        # Linux下内存和网络计数直接读取 /proc 文件：一次读取同时得到物理内存和交换内存，
+        # 省去psutil额外读取 /proc/vmstat 和构造命名元组的开销；读取失败时自动改用psutil
+        self._use_proc = sys.platform.startswith('linux')
+
+        # 已打开的 /proc 文件描述符（路径 -> fd），监控期间一直保持打开，每次从偏移0重新读取
+        self._proc_fds = {}
+
+        # 警报历史记录（用于实现警报冷却机制），键为 (指标名称, 阈值) 元组
         self.alert_history = {}
 
+        # 警报冷却时间（秒），预先读出，避免每次检查都查两层配置字典
+        self._alert_cooldown = self.config['alert_settings']['alert_cooldown_seconds']
+
+        # 上一次播放警报声音的时间（单调时钟），用于限制声音播放频率
+        self._last_sound_time = None
+
+        # 按操作系统预先选好的声音播放函数（不支持的平台为None）
+        self._sound_fn = self._pick_sound_fn()
+
+        # 数据导出队列和后台导出线程（调度线程投递快照，导出线程负责写文件）
+        self._export_queue = queue.Queue()
+        self._export_thread = None
+
+        # 增量导出状态：各指标本次监控会话的导出文件 (文件对象, csv写入器, 文件路径)，
+        # 以及上次导出的最后一条数据（按对象身份定位新增数据，不受系统时间调整影响）
+        self._export_files = {}
+        self._export_last_rows = {}
+
         # 监控开始时间（用于计算运行时长）
         self.start_time = None
 
+        # 监控开始时的单调时钟读数（运行时间显示只做浮点减法，不必每秒创建datetime对象）
+        self._start_mono = None
+
+    @property
+    def data_history(self) -> Dict[str, deque]:
+        """
+        按指标名称组织的数据历史记录
+
+        采样时直接使用 _cpu_history 等属性，这里只为导出、统计等不频繁的操作
+        提供按名称遍历的视图（字典中的值就是原始deque，不做复制）。
+
+        Returns:
+            Dict[str, deque]: 指标名称到数据历史deque的映射
+        """
+        return {
+            'cpu': self._cpu_history,
+            'memory': self._mem_history,
+            'network': self._net_history,
+            'disk': self._disk_history,
+        }
+
     def _load_config(self) -> Dict[str, Any]:
         """
         加载配置文件
@@ -135,6 +320,12 @@ class EnhancedSystemMonitor:
             "enable_console_output": True,  # 启用控制台输出
             "enable_file_output": True,  # 启用文件输出
 
+            # 日志轮转设置
+            "log_rotation": {
+                "max_size_mb": 10,  # 单个日志文件最大大小（MB）
+                "backup_count": 5  # 保留的日志文件备份数量
+            },
+
             # 数据导出设置
             "data_export": {
                 "enable_csv_export": True,  # 启用CSV数据导出
@@ -159,14 +350,21 @@ class EnhancedSystemMonitor:
 
         # 尝试加载配置文件
         try:
-            if os.path.exists(self.config_file):
-                # 以UTF-8编码打开配置文件
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    # 解析JSON配置
-                    config = json.load(f)
-                    # 用配置文件中的值更新默认配置
-                    default_config.update(config)
-                    print(f"成功加载配置文件: {self.config_file}")
+            path = os.path.abspath(self.config_file)
+            # 以路径+修改时间为键，文件被修改后自然失效；
+            # 文件不存在时os.stat直接抛出FileNotFoundError，不必先用os.path.exists检查
+            key = (path, os.stat(path).st_mtime_ns)
+            config = _CONFIG_CACHE.get(key)
+            if config is None:
+                # 以字节读取后直接解析（JSON规定为UTF-8编码）
+                with open(path, 'rb') as f:
+                    config = _json.loads(f.read())
+                _CONFIG_CACHE[key] = config
+                print(f"成功加载配置文件: {self.config_file}")
+            # 用配置文件中的值更新默认配置（深拷贝，实例修改配置时不会污染缓存）
+            default_config.update(copy.deepcopy(config))
+        except FileNotFoundError:
+            pass  # 没有配置文件时使用默认配置
         except Exception as e:
             # 如果配置文件加载失败，使用默认配置并记录错误
             print(f"加载配置文件失败，使用默认配置: {e}")
@@ -186,16 +384,16 @@ class EnhancedSystemMonitor:
         日志配置说明：
         - 日志格式：时间 - 级别 - 消息
         - 时间格式：YYYY-MM-DD HH:MM:SS
-        - 文件输出：logs/enhanced_monitor_YYYYMMDD.log
+        - 文件输出：logs/enhanced_monitor_YYYYMMDD.log（按大小轮转，参数见log_rotation）
         - 控制台输出：实时显示日志信息
+        - 写入方式：记录器只挂一个QueueHandler，监控线程记日志只是入队，
+          真正的文件/控制台写入由QueueListener后台线程完成
         - 编码：UTF-8（支持中文）
         - 日志级别：从配置文件中读取
         """
-        # 创建日志目录（如果不存在）
+        # 创建日志目录（已存在时不报错，一次调用完成检查和创建，没有竞态）
         log_dir = 'logs'
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-            print(f"创建日志目录: {log_dir}")
+        os.makedirs(log_dir, exist_ok=True)
 
         # 定义日志格式
         log_format = '%(asctime)s - %(levelname)s - %(message)s'  # 时间 - 级别 - 消息
@@ -206,19 +404,30 @@ class EnhancedSystemMonitor:
         # 设置日志级别（从配置中读取）
         logger.setLevel(getattr(logging, self.config['log_level']))
 
-        # 清除现有的处理器（避免重复添加）
+        # 清除现有的处理器（避免重复添加），并停止上一个实例留下的日志监听线程
         logger.handlers.clear()
+        self._stop_log_listener()
+
+        # 实际执行写入的处理器，由后台监听线程调用
+        handlers = []
 
         # 添加文件处理器（如果启用文件输出）
         if self.config['enable_file_output']:
             # 生成日志文件名，包含当前日期和"enhanced"标识
-            log_filename = f'{log_dir}/enhanced_monitor_{datetime.now().strftime("%Y%m%d")}.log'
-            # 创建文件处理器，使用UTF-8编码
-            file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+            log_filename = f'{log_dir}/enhanced_monitor_{time.strftime("%Y%m%d")}.log'
+            # 创建按大小轮转的文件处理器，使用UTF-8编码，首次写入时才打开文件
+            # 配置文件只写了部分轮转参数时（_load_config是浅合并），缺少的项使用默认值
+            rotation = self.config.get('log_rotation') or {}
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_filename,
+                maxBytes=rotation.get('max_size_mb', 10) * 1024 * 1024,
+                backupCount=rotation.get('backup_count', 5),
+                encoding='utf-8',
+                delay=True
+            )
             # 设置日志格式
             file_handler.setFormatter(logging.Formatter(log_format, date_format))
-            # 添加到日志记录器
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
             print(f"增强版日志文件输出已启用: {log_filename}")
 
         # 添加控制台处理器（如果启用控制台输出）
@@ -227,12 +436,32 @@ class EnhancedSystemMonitor:
             console_handler = logging.StreamHandler()
             # 设置日志格式
             console_handler.setFormatter(logging.Formatter(log_format, date_format))
-            # 添加到日志记录器
-            logger.addHandler(console_handler)
+            handlers.append(console_handler)
             print("增强版控制台日志输出已启用")
 
+        # 记录器只挂一个QueueHandler，日志记录入队后立即返回，
+        # 由QueueListener后台线程依次交给上面的处理器写出
+        if handlers:
+            log_queue = queue.SimpleQueue()
+            logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+            listener.start()
+            EnhancedSystemMonitor._log_listener = listener
+
         return logger
 
+    @classmethod
+    def _stop_log_listener(cls) -> None:
+        """
+        停止后台写日志的监听线程
+
+        QueueListener.stop() 会先写完队列中剩余的日志再退出。
+        重新配置日志时和程序退出时（通过atexit注册）调用。
+        """
+        if cls._log_listener is not None:
+            cls._log_listener.stop()
+            cls._log_listener = None
+
     def format_bytes(self, bytes_value: int) -> str:
         """
         格式化字节数为可读格式
@@ -251,19 +480,9 @@ class EnhancedSystemMonitor:
             format_bytes(1048576) -> "1.00 MB"
             format_bytes(1073741824) -> "1.00 GB"
         """
-        # 定义字节单位（从小到大）
-        units = ['B', 'KB', 'MB', 'GB', 'TB']
-
-        # 遍历所有单位，找到合适的单位
-        for unit in units:
-            # 如果字节数小于1024，使用当前单位
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.2f} {unit}"
-            # 否则除以1024，继续检查下一个单位
-            bytes_value /= 1024.0
-
-        # 如果所有单位都不合适，使用PB（拍字节）
-        return f"{bytes_value:.2f} PB"
+        # 由二进制位数直接算出单位级别：每 10 位（1024倍）升一级，最高到PB
+        i = min(max((int(bytes_value).bit_length() - 1) // 10, 0), len(_BYTE_UNITS) - 1)
+        return f"{bytes_value / _UNIT_SCALES[i]:.2f} {_BYTE_UNITS[i]}"
 
     def format_speed(self, bytes_per_sec: float) -> str:
         """
@@ -283,15 +502,11 @@ class EnhancedSystemMonitor:
             format_speed(1048576) -> "1.00 MB/s"
             format_speed(1073741824) -> "1.00 GB/s"
         """
-        # 根据速度大小选择合适的单位
-        if bytes_per_sec >= 1024 ** 3:  # 大于等于1GB/s
-            return f"{bytes_per_sec / (1024 ** 3):.2f} GB/s"
-        elif bytes_per_sec >= 1024 ** 2:  # 大于等于1MB/s
-            return f"{bytes_per_sec / (1024 ** 2):.2f} MB/s"
-        elif bytes_per_sec >= 1024:  # 大于等于1KB/s
-            return f"{bytes_per_sec / 1024:.2f} KB/s"
-        else:  # 小于1KB/s，使用字节/秒
+        # 与format_bytes相同，按二进制位数选择单位，最高到GB/s
+        i = min(max((int(bytes_per_sec).bit_length() - 1) // 10, 0), len(_SPEED_UNITS) - 1)
+        if i == 0:  # 小于1KB/s，使用字节/秒
             return f"{bytes_per_sec:.0f} B/s"
+        return f"{bytes_per_sec / _UNIT_SCALES[i]:.2f} {_SPEED_UNITS[i]}"
 
     def get_system_info(self) -> Dict[str, Any]:
         """
@@ -317,7 +532,7 @@ class EnhancedSystemMonitor:
         """
         try:
             # 获取CPU信息
-            cpu_count = psutil.cpu_count(logical=True)  # 逻辑核心数（包括超线程）
+            cpu_count = self._cpu_count  # 逻辑核心数（包括超线程，初始化时已缓存）
             cpu_freq = psutil.cpu_freq()  # CPU频率信息
 
             # 获取内存信息
@@ -326,21 +541,24 @@ class EnhancedSystemMonitor:
             # 获取磁盘信息（根目录）
             disk = psutil.disk_usage('/')  # 根目录磁盘使用情况
 
-            # 获取网络接口信息
-            net_if_addrs = psutil.net_if_addrs()  # 所有网络接口地址
+            # 获取网络接口信息：每个接口只取第一个IPv4地址
             network_interfaces = []
-
-            # 遍历所有网络接口，提取IPv4地址
-            for interface, addrs in net_if_addrs.items():
-                for addr in addrs:
-                    # 检查是否为IPv4地址（family == 2表示IPv4）
-                    if hasattr(addr, 'family') and addr.family == 2:
-                        network_interfaces.append({
-                            'interface': interface,  # 接口名称
-                            'address': addr.address,  # IP地址
-                            'netmask': addr.netmask  # 子网掩码
-                        })
-                        break  # 只取第一个IPv4地址
+            for interface, addrs in psutil.net_if_addrs().items():
+                addr = next((a for a in addrs if a.family == socket.AF_INET), None)
+                if addr is not None:
+                    network_interfaces.append({
+                        'interface': interface,  # 接口名称
+                        'address': addr.address,  # IP地址
+                        'netmask': addr.netmask  # 子网掩码
+                    })
+
+            # 运行期间不会变化的信息只获取一次
+            if self._static_info is None:
+                self._static_info = {
+                    'platform': platform.platform(),  # 操作系统平台信息
+                    'python_version': platform.python_version(),  # Python版本
+                    'boot_time': datetime.fromtimestamp(psutil.boot_time()).strftime('%Y-%m-%d %H:%M:%S')  # 系统启动时间
+                }
 
             # 构建系统信息字典
             return {
@@ -350,14 +568,12 @@ class EnhancedSystemMonitor:
                 'memory_available': memory.available,  # 可用内存（字节）
                 'disk_total': disk.total,  # 总磁盘空间（字节）
                 'disk_free': disk.free,  # 可用磁盘空间（字节）
-                'platform': platform.platform(),  # 操作系统平台信息
-                'python_version': platform.python_version(),  # Python版本
                 'network_interfaces': network_interfaces,  # 网络接口列表
-                'boot_time': datetime.fromtimestamp(psutil.boot_time()).strftime('%Y-%m-%d %H:%M:%S')  # 系统启动时间
+                **self._static_info  # 平台、Python版本、启动时间
             }
         except Exception as e:
             # 如果获取系统信息失败，记录错误并返回空字典
-            self.logger.error(f"获取系统信息失败: {e}")
+            self.logger.error("获取系统信息失败: %s", e)
             return {}
 
     def check_alert_conditions(self, metric: str, value: float, threshold: float) -> bool:
@@ -376,7 +592,7 @@ class EnhancedSystemMonitor:
             bool: True表示需要发送警报，False表示不需要
 
         工作原理：
-        1. 生成唯一的警报键（metric_threshold）
+        1. 以 (metric, threshold) 元组作为警报键，无需每次拼接字符串
         2. 检查是否在冷却时间内
         3. 如果超过阈值且不在冷却时间内，记录警报时间并返回True
         4. 否则返回False
@@ -385,22 +601,17 @@ class EnhancedSystemMonitor:
             check_alert_conditions('cpu', 85.0, 80.0) -> True（CPU使用率85%超过80%阈值）
             check_alert_conditions('cpu', 85.0, 80.0) -> False（在冷却时间内）
         """
-        # 获取当前时间戳
-        current_time = time.time()
-
-        # 生成唯一的警报键（指标名称_阈值）
-        alert_key = f"{metric}_{threshold}"
+        # 获取当前时间（冷却时间是相对间隔，使用单调时钟，不受系统校时影响）
+        current_time = time.monotonic()
 
-        # 检查冷却时间机制
-        if alert_key in self.alert_history:
-            # 获取上次警报时间
-            last_alert_time = self.alert_history[alert_key]
-            # 获取冷却时间配置（默认300秒）
-            cooldown = self.config['alert_settings']['alert_cooldown_seconds']
+        # 警报键（指标名称, 阈值）
+        alert_key = (metric, threshold)
 
-            # 如果距离上次警报时间小于冷却时间，不发送警报
-            if current_time - last_alert_time < cooldown:
-                return False
+        # 检查冷却时间机制：一次get代替in + []两次查找
+        last_alert_time = self.alert_history.get(alert_key)
+        if last_alert_time is not None and current_time - last_alert_time < self._alert_cooldown:
+            # 距离上次警报时间小于冷却时间，不发送警报
+            return False
 
         # 检查是否超过阈值
         if value > threshold:
@@ -410,6 +621,40 @@ class EnhancedSystemMonitor:
 
         return False  # 不需要发送警报
 
+    def _pick_sound_fn(self) -> Optional[Callable[[], Any]]:
+        """
+        按操作系统选择声音播放函数
+
+        只在初始化时判断一次平台并导入所需模块，返回一个无参可调用对象，
+        play_alert_sound 每次只需直接调用它。
+
+        Returns:
+            Optional[Callable[[], Any]]: 声音播放函数，不支持的平台返回None
+
+        支持的平台：
+        - Windows: winsound.MessageBeep（在部分系统上会阻塞，放到守护线程中执行）
+        - Linux: beep命令（需要安装beep包），启动后不等待结束
+        - macOS: afplay命令播放系统声音文件，启动后不等待结束
+        """
+        system = platform.system()
+
+        if system == 'Windows':
+            # Windows系统使用内置的警报声
+            import winsound
+            return lambda: threading.Thread(target=winsound.MessageBeep, daemon=True).start()
+
+        if system == 'Linux':
+            # Linux系统使用beep命令
+            return functools.partial(subprocess.Popen, ['beep'],
+                                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        if system == 'Darwin':
+            # macOS系统使用afplay命令播放系统声音
+            return functools.partial(subprocess.Popen, ['afplay', '/System/Library/Sounds/Ping.aiff'],
+                                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        return None
+
     def play_alert_sound(self):
         """
         播放警报声音
@@ -426,40 +671,46 @@ class EnhancedSystemMonitor:
         - 需要确保声音警报功能已启用（enable_sound_alerts = True）
         - Linux系统需要安装beep包：sudo apt-get install beep
         - 如果播放失败，会记录警告日志但不影响监控功能
+        - 声音在后台播放，不等待其结束，避免阻塞监控线程
+        - 两次播放至少间隔 SOUND_MIN_INTERVAL 秒，防止短时间内启动大量子进程
         """
         # 检查是否启用声音警报
         if not self.config['alert_settings']['enable_sound_alerts']:
             return  # 如果未启用，直接返回
 
-        try:
-            # 根据操作系统选择不同的声音播放方式
-            if platform.system() == 'Windows':
-                # Windows系统使用内置的警报声
-                import winsound
-                winsound.MessageBeep()  # 播放系统默认警报声
+        # 限制播放频率
+        now = time.monotonic()
+        if self._last_sound_time is not None and now - self._last_sound_time < self.SOUND_MIN_INTERVAL:
+            return
+        self._last_sound_time = now
 
-            elif platform.system() == 'Linux':
-                # Linux系统使用beep命令（需要安装beep包）
-                subprocess.run(['beep'], capture_output=True)
+        # 当前平台不支持声音警报
+        if self._sound_fn is None:
+            return
 
-            elif platform.system() == 'Darwin':
-                # macOS系统使用afplay命令播放系统声音
-                subprocess.run(['afplay', '/System/Library/Sounds/Ping.aiff'], capture_output=True)
+        try:
+            # 调用初始化时按操作系统选好的播放函数
+            self._sound_fn()
 
         except Exception as e:
             # 如果播放声音失败，记录警告日志但不中断监控
-            self.logger.warning(f"播放警报声音失败: {e}")
+            self.logger.warning("播放警报声音失败: %s", e)
 
-    def export_data_to_csv(self):
+    def export_data_to_csv(self, snapshot: Optional[Dict[str, tuple]] = None):
         """
         导出监控数据到CSV文件
 
         将收集的监控数据导出为CSV格式，便于后续分析和处理。
         支持导出CPU、内存、网络和磁盘的监控数据。
 
+        Args:
+            snapshot (Dict[str, tuple], optional): 数据历史快照，默认在调用时现取一份
+
         导出功能：
         - 自动创建导出目录
         - 使用时间戳命名文件，避免覆盖
+        - 增量导出：每个指标在一次监控会话中只创建一个文件，之后每次只追加
+          上次导出之后新增的数据行，不再每次重写全部历史数据
         - 支持UTF-8编码，确保中文正常显示
         - 包含详细的列标题和数据说明
 
@@ -473,6 +724,7 @@ class EnhancedSystemMonitor:
         - 只有在启用CSV导出功能时才会执行
         - 如果数据历史为空，不会创建文件
         - 导出完成后会记录日志信息
+        - 导出文件在监控停止时由 _close_export_files 关闭
         """
         # 检查是否启用CSV导出功能
         if not self.config['data_export']['enable_csv_export']:
@@ -481,40 +733,128 @@ class EnhancedSystemMonitor:
         # 获取导出目录路径
         export_dir = self.config['data_export']['csv_directory']
 
-        # 创建导出目录（如果不存在）
-        if not os.path.exists(export_dir):
-            os.makedirs(export_dir)
-            print(f"创建数据导出目录: {export_dir}")
+        # 创建导出目录（已存在时不报错，一次调用完成检查和创建，没有竞态）
+        os.makedirs(export_dir, exist_ok=True)
 
-        # 生成时间戳（用于文件名）
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # 未传入快照时现取一份，避免写文件期间数据被采样线程修改
+        if snapshot is None:
+            snapshot = self._snapshot_history()
 
-        # 导出CPU监控数据
-        if self.data_history['cpu']:
-            cpu_file = f"{export_dir}/cpu_data_{timestamp}.csv"
-            with open(cpu_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                # 写入CSV头部
-                writer.writerow(['Timestamp', 'CPU_Percent', 'Core_Count'])
-                # 写入数据行
-                for data in self.data_history['cpu']:
-                    writer.writerow([data['timestamp'], data['cpu_percent'], data['core_count']])
-            print(f"CPU数据已导出: {cpu_file}")
-
-        # 导出内存监控数据
-        if self.data_history['memory']:
-            memory_file = f"{export_dir}/memory_data_{timestamp}.csv"
-            with open(memory_file, 'w', newline='', encoding='utf-8') as f:
+        # 生成时间戳（用于文件名）
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+
+        # 每个监控指标的导出设置：文件名前缀、CSV头部、导出的字段下标、说明
+        # （字段下标对应 CPU_FIELDS 等常量中的位置，第0列时间戳单独转换）
+        exports = (
+            ('cpu', 'cpu_data', ['Timestamp', 'CPU_Percent', 'Core_Count'], (1, 2), 'CPU'),
+            ('memory', 'memory_data', ['Timestamp', 'Memory_Percent', 'Used_GB', 'Total_GB'], (1, 2, 3), '内存'),
+            ('network', 'network_data', ['Timestamp', 'Upload_Speed', 'Download_Speed', 'Total_Sent', 'Total_Recv'],
+             (1, 2, 3, 4), '网络'),
+            ('disk', 'disk_data', ['Timestamp', 'Device', 'Mountpoint', 'Disk_Percent', 'Used_GB', 'Total_GB', 'Free_GB'],
+             (1, 2, 3, 4, 5, 6), '磁盘'),
+        )
+
+        for metric, prefix, header, columns, label in exports:
+            rows = snapshot[metric]
+            if not rows:
+                continue  # 没有数据的指标不创建文件
+
+            # 找出上次导出之后新增的数据：从尾部向前找到上次导出的最后一条，
+            # 找不到（首次导出，或新增数据已超过历史容量）时导出全部
+            last_row = self._export_last_rows.get(metric)
+            start = len(rows)
+            while start and rows[start - 1] is not last_row:
+                start -= 1
+            if start == len(rows):
+                continue  # 没有新增数据
+            self._export_last_rows[metric] = rows[-1]
+
+            entry = self._export_files.get(metric)
+            if entry is None:
+                # 本次会话首次导出该指标：创建文件并写入CSV头部
+                # （1MB写缓冲：一次导出的数据通常整份留在缓冲区，flush时一次写出）
+                export_file = f"{export_dir}/{prefix}_{timestamp}.csv"
+                f = open(export_file, 'w', newline='', encoding='utf-8', buffering=1 << 20)
                 writer = csv.writer(f)
-                # 写入CSV头部
-                writer.writerow(['Timestamp', 'Memory_Percent', 'Used_GB', 'Total_GB'])
-                # 写入数据行
-                for data in self.data_history['memory']:
-                    writer.writerow([data['timestamp'], data['memory_percent'], data['used_gb'], data['total_gb']])
-            print(f"内存数据已导出: {memory_file}")
+                writer.writerow(header)
+                entry = self._export_files[metric] = (f, writer, export_file)
+                print(f"{label}数据导出到: {export_file}")
+            f, writer, export_file = entry
+
+            # 一次writerows写入新增数据行，逐行循环交给csv模块在C层完成；
+            # 采样时只记录浮点时间戳，到写文件时才转换成日期时间
+            writer.writerows(
+                [datetime.fromtimestamp(data[0])] + [data[i] for i in columns]
+                for data in rows[start:]
+            )
+            # 每次导出后写出缓冲区，程序意外退出时已导出的数据不会丢失
+            f.flush()
 
         # 记录导出完成日志
-        self.logger.info(f"监控数据已导出到 {export_dir} 目录")
+        self.logger.info("监控数据已导出到 %s 目录", export_dir)
+
+    def _close_export_files(self) -> None:
+        """
+        关闭本次监控会话的导出文件
+
+        下一次导出会重新创建带新时间戳的文件；已导出的最后一条数据仍然保留，
+        新文件只包含之后新增的数据。
+        """
+        for f, _, _ in self._export_files.values():
+            f.close()
+        self._export_files.clear()
+
+    def _sample_cpu(self) -> None:
+        """
+        采集一次CPU数据
+
+        使用非阻塞的 psutil.cpu_percent(interval=None)，返回距离上一次调用以来的
+        CPU使用率，采样节奏完全由外层循环控制。总体使用率和各核心使用率在psutil
+        内部各自维护差值状态，因此两次调用互不影响，也不会各自阻塞一个监控间隔。
+
+        注意：
+        - 首次调用 interval=None 会返回无意义的 0.0，调用前需要先"预热"一次
+        """
+        # 获取CPU使用率信息（非阻塞）
+        cpu_percent = psutil.cpu_percent(interval=None)  # 总体CPU使用率
+        core_count = self._cpu_count  # 逻辑核心数（初始化时已缓存）
+        per_cpu = psutil.cpu_percent(interval=None, percpu=True)  # 各核心使用率
+
+        # 控制台输出（未启用时跳过CPU频率读取和所有格式化工作）
+        if self.console_output:
+            # 获取CPU频率信息（如果可用）
+            cpu_freq = psutil.cpu_freq()
+            freq_info = f" | 频率: {cpu_freq.current:.0f}MHz" if cpu_freq else ""
+
+            # 格式化输出总体CPU信息
+            self._console_lines.append(f"CPU总占用率: {cpu_percent:5.1f}% | 核心数: {core_count}{freq_info}")
+
+            # 显示各核心使用率（如果启用），拼成一行，不再逐个核心调用print；
+            # "核心N: "前缀预先生成，每个周期只格式化百分比
+            if self.config['display_settings']['show_per_core_cpu']:
+                prefixes = self._core_prefixes
+                if len(prefixes) != len(per_cpu):
+                    # 核心数发生变化（如CPU热插拔）时重新生成前缀
+                    prefixes = self._core_prefixes = [f"核心{i}: " for i in range(len(per_cpu))]
+                self._console_lines.append(
+                    "各核心占用率: " + " | ".join([prefix + "%3.0f%%" % core
+                                                  for prefix, core in zip(prefixes, per_cpu)]))
+
+        # 记录数据到历史记录
+        self._cpu_history.append((
+            time.time(),  # 时间戳
+            cpu_percent,  # 总体CPU使用率
+            core_count,  # 核心数
+            per_cpu  # 各核心使用率
+        ))
+
+        # 记录监控日志（使用%占位符，日志级别被过滤时不做字符串格式化）
+        self.logger.info("CPU使用率: %.1f%%", cpu_percent)
+
+        # 检查是否需要发送警报
+        if self.check_alert_conditions('cpu', cpu_percent, self.config['cpu_warning_threshold']):
+            self.logger.warning("CPU使用率过高: %.1f%%", cpu_percent)
+            self.play_alert_sound()  # 播放警报声音
 
     def monitor_cpu_enhanced(self, interval: float = None) -> None:
         """
@@ -550,61 +890,147 @@ class EnhancedSystemMonitor:
         # 记录监控开始日志
         self.logger.info("开始增强版CPU监控")
 
+        # 显示监控开始信息
+        print("开始监控CPU使用情况")
+        print("按 Ctrl+C 停止监控")
+        print("-" * 60)
+
         try:
-            # 显示监控开始信息
-            print("开始监控CPU使用情况")
-            print("按 Ctrl+C 停止监控")
-            print("-" * 60)
+            # 复用统一的调度循环，在当前线程中只采集CPU数据
+            self.monitoring = True
+            self._stop_event.clear()
+            self._monitor_loop(interval, (self._sample_cpu,))
 
-            # 主监控循环
-            while self.monitoring:
-                # 获取CPU使用率信息
-                cpu_percent = psutil.cpu_percent(interval=interval)  # 总体CPU使用率
-                core_count = psutil.cpu_count(logical=True)  # 逻辑核心数
-                per_cpu = psutil.cpu_percent(interval=interval, percpu=True)  # 各核心使用率
-
-                # 获取CPU频率信息（如果可用）
-                cpu_freq = psutil.cpu_freq()
-                freq_info = f" | 频率: {cpu_freq.current:.0f}MHz" if cpu_freq else ""
-
-                # 格式化输出总体CPU信息
-                print(f"CPU总占用率: {cpu_percent:5.1f}% | 核心数: {core_count}{freq_info}")
-
-                # 显示各核心使用率（如果启用）
-                if self.config['display_settings']['show_per_core_cpu']:
-                    print("各核心占用率:", end=" ")
-                    for i, core in enumerate(per_cpu):
-                        # 格式化每个核心的使用率，最后一个核心不加分隔符
-                        print(f"核心{i}: {core:3.0f}%", end=" | " if i < len(per_cpu) - 1 else "")
-                    print()  # 换行
+        except KeyboardInterrupt:
+            # 用户按Ctrl+C停止监控
+            self.monitoring = False
+            self._stop_event.set()
+            self.logger.info("CPU监控已停止")
+            print("\nCPU监控已停止")
 
-                # 记录数据到历史记录
-                self.data_history['cpu'].append({
-                    'timestamp': datetime.now(),  # 时间戳
-                    'cpu_percent': cpu_percent,  # 总体CPU使用率
-                    'core_count': core_count,  # 核心数
-                    'per_cpu': per_cpu  # 各核心使用率
-                })
+    def _read_proc(self, path: str) -> Optional[bytes]:
+        """
+        读取一个 /proc 文件的全部内容
 
-                # 记录监控日志
-                self.logger.info(f"CPU使用率: {cpu_percent:.1f}%")
+        文件描述符在首次读取时打开并保存在 self._proc_fds 中，之后每个周期用
+        os.pread 从偏移0读取，省去每次 open/close 的路径查找和系统调用；
+        内核每次读取都会重新生成内容，因此读到的总是最新数据。
 
-                # 检查是否需要发送警报
-                if self.check_alert_conditions('cpu', cpu_percent, self.config['cpu_warning_threshold']):
-                    self.logger.warning(f"CPU使用率过高: {cpu_percent:.1f}%")
-                    self.play_alert_sound()  # 播放警报声音
+        Args:
+            path (str): 文件路径
 
-                # 等待下一个监控周期
-                time.sleep(interval)
+        Returns:
+            Optional[bytes]: 文件内容；读取失败时返回None，并且之后不再尝试 /proc
+        """
+        try:
+            fd = self._proc_fds.get(path)
+            if fd is None:
+                fd = self._proc_fds[path] = os.open(path, os.O_RDONLY)
+            # 内核会尽量填满缓冲区，读到的字节数小于缓冲区大小说明已到文件末尾
+            data = os.pread(fd, 65536, 0)
+            while len(data) % 65536 == 0 and data:
+                chunk = os.pread(fd, 65536, len(data))
+                if not chunk:
+                    break
+                data += chunk
+            return data
+        except OSError:
+            self._use_proc = False
+            self._close_proc_fds()
+            return None
+
+    def _close_proc_fds(self) -> None:
+        """
+        关闭保持打开的 /proc 文件描述符（下次读取时会重新打开）
+        """
+        for fd in self._proc_fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._proc_fds.clear()
+
+    def _read_memory(self) -> Tuple[int, int, int, float, int, int, float]:
+        """
+        读取物理内存和交换内存信息
 
-        except KeyboardInterrupt:
-            # 用户按Ctrl+C停止监控
-            self.logger.info("CPU监控已停止")
-            print("\nCPU监控已停止")
-        except Exception as e:
-            # 其他异常处理
-            self.logger.error(f"CPU监控出错: {str(e)}")
-            print(f"\n监控出错: {str(e)}")
+        Linux下只读取一次 /proc/meminfo，按psutil相同的公式计算已用内存和使用率；
+        其他平台或读取失败时使用 psutil.virtual_memory() 和 psutil.swap_memory()。
+
+        Returns:
+            Tuple: (总内存, 已用内存, 可用内存, 内存使用率, 总交换内存, 已用交换内存, 交换内存使用率)，
+            容量单位为字节，使用率为百分比
+        """
+        data = self._read_proc(_PROC_MEMINFO) if self._use_proc else None
+        if data is not None:
+            info = _parse_meminfo(data)
+            total = info[b'MemTotal']
+            free = info[b'MemFree']
+            available = info.get(b'MemAvailable', free)
+            # 已用 = 总量 - 可用，与psutil的计算方式一致
+            used = total - available
+            percent = round(used / total * 100, 1) if total else 0.0
+            swap_total = info.get(b'SwapTotal', 0)
+            swap_used = swap_total - info.get(b'SwapFree', 0)
+            swap_percent = round(swap_used / swap_total * 100, 1) if swap_total else 0.0
+            return total, used, available, percent, swap_total, swap_used, swap_percent
+
+        memory = psutil.virtual_memory()  # 物理内存信息
+        swap = psutil.swap_memory()  # 交换内存信息
+        return (memory.total, memory.used, memory.available, memory.percent,
+                swap.total, swap.used, swap.percent)
+
+    def _sample_memory(self) -> None:
+        """
+        采集一次内存数据
+
+        一次读取物理内存和交换内存信息，输出、记录历史并检查警报。
+        """
+        # 获取内存信息（字节）
+        total, used, available, memory_percent, swap_total, swap_used, swap_percent = self._read_memory()
+
+        # 计算物理内存使用情况（转换为GB）
+        total_gb = total / _GIB  # 总内存（GB）
+        used_gb = used / _GIB  # 已用内存（GB）
+
+        # 计算交换内存使用情况（转换为GB）
+        swap_total_gb = swap_total / _GIB  # 总交换内存（GB）
+        swap_used_gb = swap_used / _GIB  # 已用交换内存（GB）
+
+        # 控制台输出（未启用时跳过格式化）
+        if self.console_output:
+            available_gb = available / _GIB  # 可用内存（GB），仅用于显示
+
+            # 格式化输出物理内存信息
+            self._console_lines.append(f"内存使用率: {memory_percent:5.1f}% | "
+                                       f"总量: {total_gb:6.1f}GB | "
+                                       f"已用: {used_gb:6.1f}GB | "
+                                       f"可用: {available_gb:6.1f}GB")
+
+            # 显示交换内存信息（如果存在）
+            if swap_total_gb > 0:
+                self._console_lines.append(f"交换内存: {swap_percent:5.1f}% | "
+                                           f"总量: {swap_total_gb:6.1f}GB | "
+                                           f"已用: {swap_used_gb:6.1f}GB")
+
+        # 记录数据到历史记录
+        self._mem_history.append((
+            time.time(),  # 时间戳
+            memory_percent,  # 物理内存使用率
+            used_gb,  # 已用物理内存（GB）
+            total_gb,  # 总物理内存（GB）
+            swap_percent,  # 交换内存使用率
+            swap_used_gb,  # 已用交换内存（GB）
+            swap_total_gb  # 总交换内存（GB）
+        ))
+
+        # 记录监控日志（使用%占位符，日志级别被过滤时不做字符串格式化）
+        self.logger.info("内存使用率: %.1f%%, 已用: %.1fGB/%.1fGB", memory_percent, used_gb, total_gb)
+
+        # 检查是否需要发送警报
+        if self.check_alert_conditions('memory', memory_percent, self.config['memory_warning_threshold']):
+            self.logger.warning("内存使用率过高: %.1f%%", memory_percent)
+            self.play_alert_sound()  # 播放警报声音
 
     def monitor_memory_enhanced(self, interval: float = None) -> None:
         """
@@ -640,71 +1066,118 @@ class EnhancedSystemMonitor:
         # 记录监控开始日志
         self.logger.info("开始增强版内存监控")
 
-        try:
-            # 显示监控开始信息
-            print("开始监控内存使用情况")
-            print("按 Ctrl+C 停止监控")
-            print("-" * 60)
-
-            # 主监控循环
-            while self.monitoring:
-                # 获取内存信息
-                memory = psutil.virtual_memory()  # 物理内存信息
-                swap = psutil.swap_memory()  # 交换内存信息
-
-                # 计算物理内存使用情况（转换为GB）
-                total_gb = memory.total / (1024 ** 3)  # 总内存（GB）
-                used_gb = memory.used / (1024 ** 3)  # 已用内存（GB）
-                available_gb = memory.available / (1024 ** 3)  # 可用内存（GB）
-                memory_percent = memory.percent  # 内存使用率（百分比）
-
-                # 计算交换内存使用情况（转换为GB）
-                swap_total_gb = swap.total / (1024 ** 3)  # 总交换内存（GB）
-                swap_used_gb = swap.used / (1024 ** 3)  # 已用交换内存（GB）
-                swap_percent = swap.percent  # 交换内存使用率（百分比）
-
-                # 格式化输出物理内存信息
-                print(f"内存使用率: {memory_percent:5.1f}% | "
-                      f"总量: {total_gb:6.1f}GB | "
-                      f"已用: {used_gb:6.1f}GB | "
-                      f"可用: {available_gb:6.1f}GB")
-
-                # 显示交换内存信息（如果存在）
-                if swap_total_gb > 0:
-                    print(f"交换内存: {swap_percent:5.1f}% | "
-                          f"总量: {swap_total_gb:6.1f}GB | "
-                          f"已用: {swap_used_gb:6.1f}GB")
-
-                # 记录数据到历史记录
-                self.data_history['memory'].append({
-                    'timestamp': datetime.now(),  # 时间戳
-                    'memory_percent': memory_percent,  # 物理内存使用率
-                    'used_gb': used_gb,  # 已用物理内存（GB）
-                    'total_gb': total_gb,  # 总物理内存（GB）
-                    'swap_percent': swap_percent,  # 交换内存使用率
-                    'swap_used_gb': swap_used_gb,  # 已用交换内存（GB）
-                    'swap_total_gb': swap_total_gb  # 总交换内存（GB）
-                })
-
-                # 记录监控日志
-                self.logger.info(f"内存使用率: {memory_percent:.1f}%, 已用: {used_gb:.1f}GB/{total_gb:.1f}GB")
-
-                # 检查是否需要发送警报
-                if self.check_alert_conditions('memory', memory_percent, self.config['memory_warning_threshold']):
-                    self.logger.warning(f"内存使用率过高: {memory_percent:.1f}%")
-                    self.play_alert_sound()  # 播放警报声音
+        # 显示监控开始信息
+        print("开始监控内存使用情况")
+        print("按 Ctrl+C 停止监控")
+        print("-" * 60)
 
-                # 等待下一个监控周期
-                time.sleep(interval)
+        try:
+            # 复用统一的调度循环，在当前线程中只采集内存数据
+            self.monitoring = True
+            self._stop_event.clear()
+            self._monitor_loop(interval, (self._sample_memory,))
 
         except KeyboardInterrupt:
             # 用户按Ctrl+C停止监控
+            self.monitoring = False
+            self._stop_event.set()
             self.logger.info("内存监控已停止")
             print("\n内存监控已停止")
-        except Exception as e:
-            # 其他异常处理
-            self.logger.error(f"内存监控出错: {str(e)}")
-            print(f"\n监控出错: {str(e)}")
+
+    def _scan_active_interfaces(self) -> List[str]:
+        """
+        扫描活跃的网络接口
+
+        找出带有非回环IPv4地址的接口（与原先每次采样时的筛选条件相同）。
+
+        Returns:
+            List[str]: 活跃接口名称列表
+        """
+        active_interfaces = []
+
+        for interface, addrs in psutil.net_if_addrs().items():
+            # 检查是否有IPv4地址且不是回环地址
+            if any(addr.family == socket.AF_INET and not addr.address.startswith('127.') for addr in addrs):
+                active_interfaces.append(interface)
+
+        return active_interfaces
+
+    def _sample_network(self) -> None:
+        """
+        采集一次网络数据
+
+        与上一次采样的累计字节数做差，计算这段时间内的上传/下载速度。
+        上一次的计数保存在 self._last_net 中，首次调用只记录基准值、不输出。
+        """
+        # 获取当前网络统计信息（Linux下直接解析 /proc/net/dev，否则使用psutil）
+        data = self._read_proc(_PROC_NET_DEV) if self._use_proc else None
+        if data is not None:
+            current_bytes_sent, current_bytes_recv = _parse_net_dev(data)
+        else:
+            net_io = psutil.net_io_counters()
+            current_bytes_sent = net_io.bytes_sent  # 当前发送字节数
+            current_bytes_recv = net_io.bytes_recv  # 当前接收字节数
+        current_time = time.time()  # 当前时间戳
+
+        # 首次采样：只记录基准值，下一次才能计算速度
+        if self._last_net is None:
+            self._last_net = (current_bytes_sent, current_bytes_recv, current_time)
+            return
+        last_bytes_sent, last_bytes_recv, last_time = self._last_net
+
+        # 计算速度差值
+        time_diff = current_time - last_time  # 时间差（秒）
+        bytes_sent_diff = current_bytes_sent - last_bytes_sent  # 发送字节差
+        bytes_recv_diff = current_bytes_recv - last_bytes_recv  # 接收字节差
+
+        # 计算网络速度（字节/秒）
+        upload_speed = bytes_sent_diff / time_diff  # 上传速度
+        download_speed = bytes_recv_diff / time_diff  # 下载速度
+
+        # 获取活跃网络接口（使用缓存，每隔 IFACE_REFRESH_SECONDS 秒刷新一次）
+        # 刷新间隔用单调时钟计时，不受系统时间调整影响
+        now = time.monotonic()
+        if (self._ifaces_refreshed_at is None or
+                now - self._ifaces_refreshed_at >= self.IFACE_REFRESH_SECONDS):
+            self._active_ifaces = self._scan_active_interfaces()
+            self._ifaces_refreshed_at = now
+        active_interfaces = self._active_ifaces
+
+        # 控制台输出（未启用时跳过格式化）
+        if self.console_output:
+            # 格式化输出网络速度信息
+            self._console_lines.append(f"上传速度: {self.format_speed(upload_speed):>10} | "
+                                       f"下载速度: {self.format_speed(download_speed):>10}")
+
+            # 显示活跃网络接口（如果启用）
+            if self.config['display_settings']['show_network_interfaces']:
+                self._console_lines.append(f"活跃接口: {', '.join(active_interfaces[:3])}")  # 只显示前3个接口
+
+        # 记录数据到历史记录
+        self._net_history.append((
+            current_time,  # 时间戳（复用计算速度时取的时间）
+            upload_speed,  # 上传速度
+            download_speed,  # 下载速度
+            current_bytes_sent,  # 总发送字节数
+            current_bytes_recv,  # 总接收字节数
+            active_interfaces  # 活跃接口列表
+        ))
+
+        # 记录监控日志（参数本身需要调用format_speed，先检查日志级别再格式化）
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("网络速度 - 上传: %s, 下载: %s",
+                             self.format_speed(upload_speed), self.format_speed(download_speed))
+
+        # 检查是否需要发送警报（上传或下载速度超过阈值）
+        if (self.check_alert_conditions('network_upload', upload_speed, self.config['network_speed_warning']) or
+                self.check_alert_conditions('network_download', download_speed,
+                                            self.config['network_speed_warning'])):
+            self.logger.warning("网络速度异常 - 上传: %s, 下载: %s",
+                                self.format_speed(upload_speed), self.format_speed(download_speed))
+            self.play_alert_sound()  # 播放警报声音
+
+        # 更新上一次的值，为下次计算做准备
+        self._last_net = (current_bytes_sent, current_bytes_recv, current_time)
 
     def monitor_network_enhanced(self, interval: float = None) -> None:
         """
@@ -747,102 +1220,85 @@ class EnhancedSystemMonitor:
         # 记录监控开始日志
         self.logger.info("开始增强版网络监控")
 
-        try:
-            # 显示监控开始信息
-            print("开始监控网络使用情况")
-            print("正在初始化网络统计...")
-            print("按 Ctrl+C 停止监控")
-            print("-" * 60)
+        # 显示监控开始信息
+        print("开始监控网络使用情况")
+        print("正在初始化网络统计...")
+        print("按 Ctrl+C 停止监控")
+        print("-" * 60)
 
-            # 获取初始网络统计信息
-            net_io = psutil.net_io_counters()
-            last_bytes_sent = net_io.bytes_sent  # 初始发送字节数
-            last_bytes_recv = net_io.bytes_recv  # 初始接收字节数
-            last_time = time.time()  # 初始时间戳
+        try:
+            # 复用统一的调度循环，在当前线程中只采集网络数据
+            self.monitoring = True
+            self._stop_event.clear()
+            self._monitor_loop(interval, (self._sample_network,))
 
-            # 记录初始化完成日志
-            self.logger.info("网络统计初始化完成")
+        except KeyboardInterrupt:
+            # 用户按Ctrl+C停止监控
+            self.monitoring = False
+            self._stop_event.set()
+            self.logger.info("网络监控已停止")
+            print("\n网络监控已停止")
 
-            # 等待一个监控间隔，确保有足够的时间差来计算速度
-            time.sleep(interval)
+    def _sample_disk(self) -> None:
+        """
+        采集一次磁盘数据
 
-            # 主监控循环
-            while self.monitoring:
-                # 获取当前网络统计信息
-                net_io = psutil.net_io_counters()
-                current_bytes_sent = net_io.bytes_sent  # 当前发送字节数
-                current_bytes_recv = net_io.bytes_recv  # 当前接收字节数
-                current_time = time.time()  # 当前时间戳
-
-                # 计算速度差值
-                time_diff = current_time - last_time  # 时间差（秒）
-                bytes_sent_diff = current_bytes_sent - last_bytes_sent  # 发送字节差
-                bytes_recv_diff = current_bytes_recv - last_bytes_recv  # 接收字节差
-
-                # 计算网络速度（字节/秒）
-                upload_speed = bytes_sent_diff / time_diff  # 上传速度
-                download_speed = bytes_recv_diff / time_diff  # 下载速度
-
-                # 获取网络接口信息
-                net_if_addrs = psutil.net_if_addrs()
-                active_interfaces = []
-
-                # 遍历所有网络接口，找出活跃的IPv4接口
-                for interface, addrs in net_if_addrs.items():
-                    for addr in addrs:
-                        # 检查是否为IPv4地址且不是回环地址
-                        if (hasattr(addr, 'family') and
-                                addr.family == 2 and
-                                not addr.address.startswith('127.')):
-                            active_interfaces.append(interface)
-                            break  # 只取第一个IPv4地址
-
-                # 格式化输出网络速度信息
-                print(f"上传速度: {self.format_speed(upload_speed):>10} | "
-                      f"下载速度: {self.format_speed(download_speed):>10}")
-
-                # 显示活跃网络接口（如果启用）
-                if self.config['display_settings']['show_network_interfaces']:
-                    print(f"活跃接口: {', '.join(active_interfaces[:3])}")  # 只显示前3个接口
+        遍历所有磁盘分区，输出、记录历史并检查警报。
+        单个分区无法访问时记录警告并跳过，不影响其他分区。
+        """
+        # 获取所有磁盘分区信息（使用缓存，每隔 PARTITION_REFRESH_SECONDS 秒刷新一次）
+        now = time.monotonic()
+        if now - self._partitions_refreshed_at >= self.PARTITION_REFRESH_SECONDS:
+            self._partitions = psutil.disk_partitions(all=False)
+            self._partitions_refreshed_at = now
+        disk_partitions = self._partitions
+
+        # 遍历每个磁盘分区
+        for partition in disk_partitions:
+            try:
+                # 获取磁盘使用情况
+                disk_usage = psutil.disk_usage(partition.mountpoint)
+
+                # 计算磁盘使用率（百分比）
+                disk_percent = (disk_usage.used / disk_usage.total) * 100
+
+                # 计算磁盘容量信息（转换为GB）
+                disk_total_gb = disk_usage.total / _GIB  # 总容量（GB）
+                disk_used_gb = disk_usage.used / _GIB  # 已用容量（GB）
+                disk_free_gb = disk_usage.free / _GIB  # 可用容量（GB）
+
+                # 格式化输出磁盘信息（未启用控制台输出时跳过）
+                if self.console_output:
+                    self._console_lines.append(f"分区: {partition.device} | "
+                                               f"挂载点: {partition.mountpoint} | "
+                                               f"使用率: {disk_percent:5.1f}% | "
+                                               f"已用: {disk_used_gb:6.1f}GB | "
+                                               f"可用: {disk_free_gb:6.1f}GB | "
+                                               f"总量: {disk_total_gb:6.1f}GB")
 
                 # 记录数据到历史记录
-                self.data_history['network'].append({
-                    'timestamp': datetime.now(),  # 时间戳
-                    'upload_speed': upload_speed,  # 上传速度
-                    'download_speed': download_speed,  # 下载速度
-                    'total_sent': current_bytes_sent,  # 总发送字节数
-                    'total_recv': current_bytes_recv,  # 总接收字节数
-                    'active_interfaces': active_interfaces  # 活跃接口列表
-                })
-
-                # 记录监控日志
-                self.logger.info(
-                    f"网络速度 - 上传: {self.format_speed(upload_speed)}, 下载: {self.format_speed(download_speed)}")
-
-                # 检查是否需要发送警报（上传或下载速度超过阈值）
-                if (self.check_alert_conditions('network_upload', upload_speed, self.config['network_speed_warning']) or
-                        self.check_alert_conditions('network_download', download_speed,
-                                                    self.config['network_speed_warning'])):
-                    self.logger.warning(
-                        f"网络速度异常 - 上传: {self.format_speed(upload_speed)}, 下载: {self.format_speed(download_speed)}")
+                self._disk_history.append((
+                    time.time(),  # 时间戳
+                    partition.device,  # 设备名称
+                    partition.mountpoint,  # 挂载点
+                    disk_percent,  # 使用率（百分比）
+                    disk_used_gb,  # 已用容量（GB）
+                    disk_total_gb,  # 总容量（GB）
+                    disk_free_gb  # 可用容量（GB）
+                ))
+
+                # 检查是否需要发送警报
+                if self.check_alert_conditions('disk', disk_percent, self.config['disk_warning_threshold']):
+                    self.logger.warning("磁盘使用率过高: %s - %.1f%%", partition.device, disk_percent)
                     self.play_alert_sound()  # 播放警报声音
 
-                # 更新上一次的值，为下次计算做准备
-                last_bytes_sent = current_bytes_sent
-                last_bytes_recv = current_bytes_recv
-                last_time = current_time
+            except Exception as e:
+                # 如果某个分区无法访问，记录警告但继续监控其他分区
+                self.logger.warning("无法获取分区 %s 的信息: %s", partition.device, e)
 
-                # 等待下一个监控周期
-                time.sleep(interval)
-
-        except KeyboardInterrupt:
-            # 用户按Ctrl+C停止监控
-            self.logger.info("网络监控已停止")
-            print("\n网络监控已停止")
-        except Exception as e:
-            # 其他异常处理
-            self.logger.error(f"网络监控出错: {str(e)}")
-            print(f"\n监控出错: {str(e)}")
+        # 显示分隔线
+        if self.console_output:
+            self._console_lines.append("-" * 60)
 
     def monitor_disk_enhanced(self, interval: float = None) -> None:
         """
@@ -878,90 +1334,132 @@ class EnhancedSystemMonitor:
         # 记录监控开始日志
         self.logger.info("开始增强版磁盘监控")
 
-        try:
-            # 显示监控开始信息
-            print("开始监控磁盘使用情况")
-            print("按 Ctrl+C 停止监控")
-            print("-" * 60)
+        # 显示监控开始信息
+        print("开始监控磁盘使用情况")
+        print("按 Ctrl+C 停止监控")
+        print("-" * 60)
 
-            # 主监控循环
-            while self.monitoring:
-                # 获取所有磁盘分区信息
-                disk_partitions = psutil.disk_partitions()
-
-                # 遍历每个磁盘分区
-                for partition in disk_partitions:
-                    try:
-                        # 获取磁盘使用情况
-                        disk_usage = psutil.disk_usage(partition.mountpoint)
-
-                        # 计算磁盘使用率（百分比）
-                        disk_percent = (disk_usage.used / disk_usage.total) * 100
-
-                        # 计算磁盘容量信息（转换为GB）
-                        disk_total_gb = disk_usage.total / (1024 ** 3)  # 总容量（GB）
-                        disk_used_gb = disk_usage.used / (1024 ** 3)  # 已用容量（GB）
-                        disk_free_gb = disk_usage.free / (1024 ** 3)  # 可用容量（GB）
-
-                        # 格式化输出磁盘信息
-                        print(f"分区: {partition.device} | "
-                              f"挂载点: {partition.mountpoint} | "
-                              f"使用率: {disk_percent:5.1f}% | "
-                              f"已用: {disk_used_gb:6.1f}GB | "
-                              f"可用: {disk_free_gb:6.1f}GB | "
-                              f"总量: {disk_total_gb:6.1f}GB")
-
-                        # 记录数据到历史记录
-                        self.data_history['disk'].append({
-                            'timestamp': datetime.now(),  # 时间戳
-                            'device': partition.device,  # 设备名称
-                            'mountpoint': partition.mountpoint,  # 挂载点
-                            'disk_percent': disk_percent,  # 使用率（百分比）
-                            'used_gb': disk_used_gb,  # 已用容量（GB）
-                            'total_gb': disk_total_gb,  # 总容量（GB）
-                            'free_gb': disk_free_gb  # 可用容量（GB）
-                        })
-
-                        # 检查是否需要发送警报
-                        if self.check_alert_conditions('disk', disk_percent, self.config['disk_warning_threshold']):
-                            self.logger.warning(f"磁盘使用率过高: {partition.device} - {disk_percent:.1f}%")
-                            self.play_alert_sound()  # 播放警报声音
-
-                    except Exception as e:
-                        # 如果某个分区无法访问，记录警告但继续监控其他分区
-                        self.logger.warning(f"无法获取分区 {partition.device} 的信息: {e}")
-
-                # 显示分隔线
-                print("-" * 60)
-
-                # 等待下一个监控周期
-                time.sleep(interval)
+        try:
+            # 复用统一的调度循环，在当前线程中只采集磁盘数据
+            self.monitoring = True
+            self._stop_event.clear()
+            self._monitor_loop(interval, (self._sample_disk,))
 
         except KeyboardInterrupt:
             # 用户按Ctrl+C停止监控
+            self.monitoring = False
+            self._stop_event.set()
             self.logger.info("磁盘监控已停止")
             print("\n磁盘监控已停止")
+
+    def _tick(self, samplers: Optional[Tuple] = None) -> None:
+        """
+        执行一次采样
+
+        在同一个线程里依次调用各项采样方法，默认采集CPU、内存、网络和磁盘数据。
+        这些psutil调用都很轻量，串行执行一轮通常不到1毫秒，
+        不需要为每个指标单独开线程。
+
+        Args:
+            samplers (Tuple, optional): 要执行的采样方法，默认为全部四项
+        """
+        if samplers is None:
+            samplers = (self._sample_cpu, self._sample_memory, self._sample_network, self._sample_disk)
+        for sample in samplers:
+            sample()
+        self._flush_console()
+
+    def _flush_console(self) -> None:
+        """
+        写出本周期缓存的控制台输出
+
+        各采样方法只把要显示的行追加到 self._console_lines，
+        这里一次 sys.stdout.write 写出整个周期的内容，代替逐行 print 的多次写入；
+        只有输出到终端时才主动 flush，重定向到文件或管道时交给缓冲区处理。
+        """
+        lines = self._console_lines
+        if not lines:
+            return
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+        if sys.stdout.isatty():
+            sys.stdout.flush()
+
+    def _monitor_loop(self, interval: float, samplers: Optional[Tuple] = None) -> None:
+        """
+        监控调度循环
+
+        按监控间隔统一触发采样，综合监控和各单项监控共用这一个循环，
+        取代原来每个指标一个线程、各自 sleep 的做法。CPU使用 interval=None 的
+        非阻塞采样，因此每个周期只等待一次，不会被 cpu_percent 额外阻塞。
+
+        Args:
+            interval (float): 监控间隔时间（秒）
+            samplers (Tuple, optional): 要执行的采样方法，默认为全部四项
+        """
+        # 数据导出设置：到达导出间隔时只向导出队列投递快照，不在本线程写文件
+        # （只有导出线程在运行时才投递，避免单项监控时快照在队列中堆积）
+        export_enabled = self._export_thread is not None
+        export_interval = self.config['data_export']['export_interval']
+        last_export = time.monotonic()
+
+        if samplers is None:
+            samplers = (self._sample_cpu, self._sample_memory, self._sample_network, self._sample_disk)
+
+        try:
+            # 预热（只针对本次要采集的指标）：CPU非阻塞采样需要一个起点，网络速度需要一个基准值
+            if self._sample_cpu in samplers:
+                psutil.cpu_percent(interval=None)
+                psutil.cpu_percent(interval=None, percpu=True)
+            if self._sample_network in samplers:
+                self._last_net = None
+                self._sample_network()
+
+            # 主调度循环：等到下一个采样时刻后统一采样（wait返回True表示收到停止信号）。
+            # 等待时长扣除本周期采样、导出投递所花的时间，采样时刻不会随运行时间逐渐漂移
+            next_tick = time.monotonic() + interval
+            while not self._stop_event.wait(max(0.0, next_tick - time.monotonic())):
+                if not self.monitoring:
+                    break
+                self._tick(samplers)
+
+                # 计算下一个采样时刻；若已落后一个周期以上（如系统休眠），从当前时刻重新对齐
+                next_tick += interval
+                now = time.monotonic()
+                if next_tick < now:
+                    next_tick = now + interval
+
+                # 到达导出间隔时投递一份快照给导出线程
+                if export_enabled and time.monotonic() - last_export >= export_interval:
+                    self._export_queue.put(self._snapshot_history())
+                    last_export = time.monotonic()
+
         except Exception as e:
-            # 其他异常处理
-            self.logger.error(f"磁盘监控出错: {str(e)}")
+            # 调度线程出错时记录日志，避免线程静默退出
+            self.logger.error("监控出错: %s", e)
             print(f"\n监控出错: {str(e)}")
+        finally:
+            # 采样只在本循环中进行，循环结束（包括单项监控被Ctrl+C中断）时由采样线程自己
+            # 关闭保持打开的 /proc 文件描述符，不会出现其他线程关闭后采样线程仍在读取的情况
+            self._close_proc_fds()
 
-    def start_comprehensive_monitoring(self, interval: float = None) -> None:
+    def start_comprehensive_monitoring(self, interval: float = None,
+                                       modes: Optional[List[str]] = None) -> None:
         """
-        开始综合监控（多线程）
+        开始综合监控（单调度线程）
 
-        启动多线程综合监控，同时监控CPU、内存、网络和磁盘。
-        每个监控项目在独立的线程中运行，互不干扰。
+        启动综合监控，同时监控CPU、内存、网络和磁盘。
+        所有指标由同一个调度线程按监控间隔统一采样，避免多个线程争抢GIL、
+        各自休眠带来的额外开销。
 
         Args:
             interval (float, optional): 监控间隔时间（秒），默认从配置文件读取
+            modes (List[str], optional): 要采集的指标，可选 'cpu'、'memory'、'network'、'disk'，
+                默认全部采集；未列出的指标不会调用对应的psutil接口
 
         监控线程：
-        - CPU-Monitor: CPU使用率监控线程
-        - Memory-Monitor: 内存使用率监控线程
-        - Network-Monitor: 网络速度监控线程
-        - Disk-Monitor: 磁盘使用率监控线程
-        - Data-Export: 数据导出线程（可选）
+        - Monitor-Scheduler: 综合采样调度线程（按modes采集CPU、内存、网络、磁盘）
+        - Data-Export: 数据导出线程（可选，从队列中取快照写CSV）
 
         主线程功能：
         - 显示实时运行时间
@@ -971,7 +1469,7 @@ class EnhancedSystemMonitor:
         线程特性：
         - 所有线程设置为守护线程（daemon=True）
         - 主线程退出时，所有子线程自动结束
-        - 支持优雅停止（通过self.monitoring标志）
+        - 支持优雅停止（通过self.monitoring标志和停止事件，停止时无需等满监控间隔）
 
         异常处理：
         - KeyboardInterrupt: 用户按Ctrl+C停止监控
@@ -981,11 +1479,24 @@ class EnhancedSystemMonitor:
         if interval is None:
             interval = self.config['monitor_interval']
 
+        # 按指标名称选出采样方法（None表示全部采集）
+        samplers = None
+        if modes is not None:
+            sampler_map = {
+                'cpu': self._sample_cpu,
+                'memory': self._sample_memory,
+                'network': self._sample_network,
+                'disk': self._sample_disk,
+            }
+            samplers = tuple(sampler_map[mode] for mode in modes)
+
         # 设置监控状态为开始
         self.monitoring = True
+        self._stop_event.clear()
 
         # 记录监控开始时间
         self.start_time = datetime.now()
+        self._start_mono = time.monotonic()
 
         # 记录监控开始日志
         self.logger.info("开始综合系统监控")
@@ -995,16 +1506,15 @@ class EnhancedSystemMonitor:
         print("按 Ctrl+C 停止监控")
         print("=" * 80)
 
-        # 创建监控线程列表
+        # 创建数据导出线程（如果启用，需先于调度线程启动）
+        if self.config['data_export']['enable_csv_export']:
+            self._export_thread = threading.Thread(target=self._export_worker, name="Data-Export")
+            self._export_thread.daemon = True  # 设置为守护线程
+            self._export_thread.start()  # 启动线程
+
+        # 创建监控线程列表（单个调度线程负责所有指标的采样）
         threads = [
-            # CPU监控线程
-            threading.Thread(target=self.monitor_cpu_enhanced, args=(interval,), name="CPU-Monitor"),
-            # 内存监控线程
-            threading.Thread(target=self.monitor_memory_enhanced, args=(interval,), name="Memory-Monitor"),
-            # 网络监控线程
-            threading.Thread(target=self.monitor_network_enhanced, args=(interval,), name="Network-Monitor"),
-            # 磁盘监控线程
-            threading.Thread(target=self.monitor_disk_enhanced, args=(interval,), name="Disk-Monitor")
+            threading.Thread(target=self._monitor_loop, args=(interval, samplers), name="Monitor-Scheduler")
         ]
 
         # 启动所有监控线程
@@ -1013,56 +1523,70 @@ class EnhancedSystemMonitor:
             thread.start()  # 启动线程
             self.monitor_threads.append(thread)  # 添加到线程列表
 
-        # 创建数据导出线程（如果启用）
-        if self.config['data_export']['enable_csv_export']:
-            export_thread = threading.Thread(target=self._export_data_periodically, name="Data-Export")
-            export_thread.daemon = True  # 设置为守护线程
-            export_thread.start()  # 启动线程
-            self.monitor_threads.append(export_thread)  # 添加到线程列表
-
         try:
-            # 主线程显示运行时间
+            # 主线程显示运行时间：只在输出到终端时显示（重定向到文件时 \r 刷新行没有意义），
+            # 并且只在整秒数变化时才写出
+            is_tty = sys.stdout.isatty()
+            last_elapsed = None
             while self.monitoring:
-                if self.start_time:
-                    # 计算并显示运行时间
-                    runtime = datetime.now() - self.start_time
-                    print(f"\r运行时间: {runtime}", end="", flush=True)
-                time.sleep(1)  # 每秒更新一次运行时间
+                # 计算并显示运行时间（整秒，格式为 时:分:秒）
+                elapsed = int(time.monotonic() - self._start_mono)
+                if is_tty and elapsed != last_elapsed:
+                    sys.stdout.write(f"\r运行时间: {elapsed // 3600:02d}:{elapsed % 3600 // 60:02d}:{elapsed % 60:02d}")
+                    sys.stdout.flush()
+                    last_elapsed = elapsed
+                # 每秒更新一次运行时间，收到停止信号时立即退出
+                if self._stop_event.wait(1):
+                    break
 
         except KeyboardInterrupt:
             # 用户按Ctrl+C，停止监控
             self.stop_monitoring()
 
-    def _export_data_periodically(self):
+    def _snapshot_history(self) -> Dict[str, tuple]:
+        """
+        获取数据历史记录的快照
+
+        tuple(deque) 在C层一次性完成复制，期间不会切换线程，
+        因此得到的是某一时刻一致的数据副本，导出时不受采样线程继续追加的影响。
+
+        Returns:
+            Dict[str, tuple]: 各监控指标的数据点元组
+        """
+        return {metric: tuple(data) for metric, data in self.data_history.items()}
+
+    def _export_worker(self):
         """
-        定期导出数据
+        后台数据导出线程
 
-        在后台线程中定期导出监控数据到CSV文件。
-        根据配置的导出间隔自动执行数据导出操作。
+        从导出队列中取出历史数据快照并写入CSV文件，所有磁盘I/O都在这个线程中完成，
+        调度线程只负责投递快照，不会被文件写入阻塞。
 
         工作流程：
-        1. 等待指定的导出间隔时间
-        2. 检查监控状态是否仍在运行
-        3. 如果仍在运行，执行数据导出
-        4. 重复上述过程
+        1. 阻塞等待导出队列中的快照
+        2. 收到None（停止信号）时关闭导出文件并退出
+        3. 否则调用export_data_to_csv追加该快照中的新增数据
 
         注意事项：
         - 这是一个私有方法，仅供内部使用
         - 在独立的守护线程中运行
-        - 支持优雅停止（通过self.monitoring标志）
-        - 避免在监控停止时执行导出操作
+        - 单次导出失败只记录错误日志，不影响后续导出
         """
-        # 获取导出间隔时间（从配置文件读取）
-        export_interval = self.config['data_export']['export_interval']
+        while True:
+            # 阻塞等待下一份快照
+            snapshot = self._export_queue.get()
 
-        # 定期导出循环
-        while self.monitoring:
-            # 等待指定的导出间隔时间
-            time.sleep(export_interval)
+            # None 是停止信号
+            if snapshot is None:
+                break
 
-            # 再次检查监控状态，避免在停止时导出
-            if self.monitoring:
-                self.export_data_to_csv()  # 执行数据导出
+            try:
+                self.export_data_to_csv(snapshot)  # 执行数据导出
+            except Exception as e:
+                self.logger.error("数据导出失败: %s", e)
+
+        # 退出前关闭导出文件
+        self._close_export_files()
 
     def stop_monitoring(self) -> None:
         """
@@ -1072,9 +1596,9 @@ class EnhancedSystemMonitor:
         包括等待线程结束、导出最终数据、显示统计信息等。
 
         停止流程：
-        1. 设置监控状态为False，通知所有线程停止
-        2. 等待所有监控线程结束（最多等待5秒）
-        3. 导出最终监控数据到CSV文件
+        1. 设置监控状态为False并触发停止事件，通知所有线程立即停止
+        2. 等待所有监控线程结束（所有线程合计最多等待5秒）；/proc 文件描述符由采样线程退出时自行关闭
+        3. 导出最终监控数据到CSV文件（交给导出线程写完后再退出）
         4. 显示监控统计信息（运行时间、数据点数量等）
         5. 记录停止日志
 
@@ -1084,21 +1608,30 @@ class EnhancedSystemMonitor:
         - 触发的警报次数
 
         注意事项：
-        - 使用timeout=5确保不会无限等待
+        - 所有线程共用一个5秒截止时间，确保不会无限等待
         - 即使线程未正常结束也会继续执行清理
         - 在监控停止时也会导出数据
         """
-        # 设置监控状态为False，通知所有线程停止
+        # 设置监控状态为False并触发停止事件，通知所有线程立即停止
         self.monitoring = False
+        self._stop_event.set()
 
-        # 等待所有监控线程结束
+        # 等待所有线程结束：所有线程共用一个5秒的截止时间，而不是每个线程各等5秒
+        deadline = time.monotonic() + 5
         for thread in self.monitor_threads:
             if thread.is_alive():
-                # 等待线程结束，最多等待5秒
-                thread.join(timeout=5)
+                thread.join(timeout=max(0.0, deadline - time.monotonic()))
 
         # 导出最终监控数据
-        self.export_data_to_csv()
+        if self._export_thread and self._export_thread.is_alive():
+            # 导出线程仍在运行：投递最后一份快照和停止信号，等待它写完队列中的数据
+            self._export_queue.put(self._snapshot_history())
+            self._export_queue.put(None)
+            self._export_thread.join(timeout=max(0.0, deadline - time.monotonic()))
+            self._export_thread = None
+        else:
+            self.export_data_to_csv()
+            self._close_export_files()
 
         # 显示监控运行统计信息
         if self.start_time:
@@ -1130,7 +1663,8 @@ class EnhancedSystemMonitor:
         - data_points: 各监控指标的数据点数量
         - alerts_triggered: 触发的警报次数
         - system_info: 系统信息
-        - {metric}_stats: 各监控指标的统计信息（最小值、最大值、平均值）
+        - {metric}_stats: 各监控指标的统计信息（最小值、最大值、平均值，
+          数据点不少于2个时还包括p50、p95、p99分位数）
 
         统计指标：
         - cpu_stats: CPU使用率统计
@@ -1143,45 +1677,56 @@ class EnhancedSystemMonitor:
             print(f"CPU平均使用率: {summary['cpu_stats']['avg']:.1f}%")
             print(f"总运行时间: {summary['total_runtime']}")
         """
+        # 取一份历史数据快照，统计期间不受采样线程继续追加的影响
+        history = self._snapshot_history()
+
         # 构建基础摘要信息
         summary = {
             'start_time': self.start_time,  # 监控开始时间
             'total_runtime': datetime.now() - self.start_time if self.start_time else None,  # 总运行时间
-            'data_points': {metric: len(data) for metric, data in self.data_history.items()},  # 数据点数量
+            'data_points': {metric: len(data) for metric, data in history.items()},  # 数据点数量
             'alerts_triggered': len(self.alert_history),  # 触发的警报次数
             'system_info': self.get_system_info()  # 系统信息
         }
 
-        # 计算各监控指标的统计数据
-        for metric, data in self.data_history.items():
+        # 计算各监控指标的统计数据（按 SUMMARY_COLUMNS 查表取字段，不再逐个比较指标名称）
+        for metric, columns in self.SUMMARY_COLUMNS.items():
+            data = history[metric]
             if data:  # 确保有数据才进行统计
-                # 根据监控指标类型提取相应的数值
-                if metric == 'cpu':
-                    # CPU使用率数据
-                    values = [d['cpu_percent'] for d in data]
-                elif metric == 'memory':
-                    # 内存使用率数据
-                    values = [d['memory_percent'] for d in data]
-                elif metric == 'network':
-                    # 网络总速度数据（上传+下载）
-                    values = [d['upload_speed'] + d['download_speed'] for d in data]
-                elif metric == 'disk':
-                    # 磁盘使用率数据
-                    values = [d['disk_percent'] for d in data]
+                if len(columns) == 1:
+                    # 单个字段：map + itemgetter 在C层完成取值
+                    values = list(map(itemgetter(columns[0]), data))
                 else:
-                    # 跳过未知的监控指标
-                    continue
+                    # 两个字段求和（如网络上传+下载速度）
+                    first, second = columns
+                    values = [d[first] + d[second] for d in data]
+
+                # 原地排序一次：最小值、最大值直接取两端，分位数计算时再排序已有序的数据也只需一次线性扫描
+                values.sort()
 
                 # 计算统计信息（最小值、最大值、平均值）
-                summary[f'{metric}_stats'] = {
-                    'min': min(values),  # 最小值
-                    'max': max(values),  # 最大值
-                    'avg': sum(values) / len(values)  # 平均值
+                stats = {
+                    'min': values[0],  # 最小值
+                    'max': values[-1],  # 最大值
+                    'avg': statistics.fmean(values)  # 平均值
                 }
 
+                # 计算分位数（至少需要2个数据点）
+                if len(values) >= 2:
+                    cuts = statistics.quantiles(values, n=100, method='inclusive')
+                    stats['p50'] = cuts[49]  # 中位数
+                    stats['p95'] = cuts[94]  # 95分位数
+                    stats['p99'] = cuts[98]  # 99分位数
+
+                summary[f'{metric}_stats'] = stats
+
         return summary
 
 
+# 程序退出时停止日志监听线程，确保队列中剩余的日志全部写出
+atexit.register(EnhancedSystemMonitor._stop_log_listener)
+
+
 def main():
     """
     主函数 - 增强版系统监控工具入口
@@ -1189,20 +1734,18 @@ def main():
     程序启动入口，负责初始化、用户交互和监控流程控制。
 
     程序流程：
-    1. 检查并安装必要的依赖（psutil）
-    2. 创建监控器实例
-    3. 显示系统基本信息
-    4. 提供监控模式选择
-    5. 启动相应的监控功能
-    6. 处理用户中断并显示监控摘要
+    1. 创建监控器实例（依赖psutil在模块导入时已检查）
+    2. 显示系统基本信息
+    3. 提供监控模式选择
+    4. 启动相应的监控功能
+    5. 处理用户中断并显示监控摘要
 
     监控模式：
-    - 1-4: 单项监控（实际都启动综合监控）
+    - 1-4: 单项监控（只采集所选指标，其余指标不调用psutil）
     - 5: 综合监控（推荐）
     - 其他: 默认启动综合监控
 
     异常处理：
-    - ImportError: 自动安装缺失的依赖
     - KeyboardInterrupt: 优雅停止监控并显示摘要
     - 其他异常: 记录错误日志
 
@@ -1211,18 +1754,6 @@ def main():
     - 按Ctrl+C停止监控
     - 监控结束后会显示统计摘要
     """
-    # 检查并安装必要的依赖
-    try:
-        import psutil
-    except ImportError:
-        # 如果psutil未安装，自动安装
-        import sys
-        import subprocess
-        print("正在安装必要的依赖包...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "psutil"])
-        import psutil
-        print("依赖包安装完成！")
-
     # 创建增强版系统监控器实例
     monitor = EnhancedSystemMonitor()
 
@@ -1250,21 +1781,11 @@ def main():
     choice = input("请输入选择 (1/2/3/4/5): ").strip()
 
     try:
-        # 根据用户选择启动相应的监控模式
-        # 注意：目前所有选择都启动综合监控，可以根据需要修改
-        if choice == "1":
-            monitor.start_comprehensive_monitoring()
-        elif choice == "2":
-            monitor.start_comprehensive_monitoring()
-        elif choice == "3":
-            monitor.start_comprehensive_monitoring()
-        elif choice == "4":
-            monitor.start_comprehensive_monitoring()
-        elif choice == "5":
-            monitor.start_comprehensive_monitoring()
-        else:
+        # 根据用户选择启动相应的监控模式（单项监控只采集所选指标，None表示综合监控）
+        modes = {'1': ['cpu'], '2': ['memory'], '3': ['network'], '4': ['disk'], '5': None}
+        if choice not in modes:
             print("无效选择，启动综合监控")
-            monitor.start_comprehensive_monitoring()
+        monitor.start_comprehensive_monitoring(modes=modes.get(choice))
 
     except KeyboardInterrupt:
         # 用户按Ctrl+C停止监控
@@ -17,15 +17,92 @@
 # =============================================================================
 
 # 导入必要的库
+import importlib.util  # 用于启动时检查依赖是否已安装
+import sys  # 用于缺少依赖时退出及批量写出控制台输出
+
+# 缺少psutil时直接给出安装提示并退出，不在运行时自动调用pip安装
+if importlib.util.find_spec('psutil') is None:
+    sys.exit("缺少依赖 psutil，请先执行: pip install psutil")
+
 import psutil  # 用于获取系统和进程信息
 import time  # 用于时间相关操作
 import logging  # 用于日志记录
+import logging.handlers  # 用于后台队列写日志
+import atexit  # 用于程序退出时停止日志队列监听线程
+import queue  # 用于日志记录队列
+import socket  # 用于识别IPv4地址族（socket.AF_INET）
 import os  # 用于文件和目录操作
 import threading  # 用于多线程支持
+import heapq  # 用于选出资源占用最高的前N个进程
+import statistics  # 用于计算汇报周期内CPU使用率的分位数
+from collections import deque  # 用于暂存汇报周期内的采样值
+from operator import itemgetter  # 用于按字段取排序键
 from datetime import datetime  # 用于时间戳
-from typing import Optional, Dict, Any, List  # 类型提示
+from typing import Optional, Dict, Any, List, Tuple, Callable  # 类型提示
 import json  # 用于配置文件处理
 
+# 字节单位表及对应的换算基数（第 i 级单位 = 1024 ** i 字节）
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+_SPEED_UNITS = ('B/s', 'KB/s', 'MB/s', 'GB/s')
+_UNIT_SCALES = tuple(1 << (10 * i) for i in range(len(_BYTE_UNITS)))
+
+# Linux下直接读取的内核统计文件
+_PROC_STAT = '/proc/stat'
+_PROC_MEMINFO = '/proc/meminfo'
+
+
+def _read_proc_head(path: str, size: int = 8192) -> bytes:
+    """
+    用一次 open/read/close 读取 /proc 文件的开头部分
+
+    Args:
+        path (str): 文件路径
+        size (int): 最多读取的字节数，需要的字段都在文件开头
+
+    Returns:
+        bytes: 读到的内容
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _parse_meminfo(data: bytes) -> Tuple[int, int]:
+    """
+    解析 /proc/meminfo 中的总内存和可用内存
+
+    Args:
+        data (bytes): 文件内容，每行形如 b'MemTotal:  16302112 kB'
+
+    Returns:
+        Tuple[int, int]: (总内存字节数, 可用内存字节数)；旧内核没有MemAvailable时用MemFree
+    """
+    fields = {}
+    for line in data.splitlines():
+        parts = line.split()
+        if len(parts) >= 2:
+            fields[parts[0]] = int(parts[1]) * 1024  # 文件中的数值单位为kB
+    return fields[b'MemTotal:'], fields.get(b'MemAvailable:', fields[b'MemFree:'])
+
+
+def _parse_cpu_times(data: bytes) -> Tuple[int, int]:
+    """
+    解析 /proc/stat 第一行（所有CPU的合计时间）
+
+    Args:
+        data (bytes): 文件内容，第一行形如 b'cpu  user nice system idle iowait irq softirq steal guest guest_nice'
+
+    Returns:
+        Tuple[int, int]: (总时间, 空闲时间)，单位为时钟滴答
+    """
+    values = [int(v) for v in data.split(b'\n', 1)[0].split()[1:]]
+    # guest/guest_nice 已经计入 user/nice，与psutil一样不重复计算
+    total = sum(values[:8])
+    idle = values[3] + (values[4] if len(values) > 4 else 0)  # 空闲 + 等待IO
+    return total, idle
+
 
 class SystemMonitor:
     """
@@ -40,17 +117,26 @@ class SystemMonitor:
 
     使用示例：
         monitor = SystemMonitor()
-        monitor.start_monitoring("cpu")  # 开始CPU监控
-        monitor.start_monitoring("system")  # 开始综合监控
+        monitor.start_monitoring("system")  # 在后台线程中开始综合监控
+        monitor.wait_monitoring()  # 阻塞等待，按 Ctrl+C 停止
     """
 
-    def __init__(self, log_dir: str = 'logs', config_file: str = 'monitor_config.json'):
+    # 后台写日志的监听线程（同名记录器全局唯一，重新配置日志时先停止旧的）
+    _log_listener = None
+
+    # 活跃网络接口列表的刷新周期（秒）
+    IFACE_REFRESH_SECONDS = 30
+
+    def __init__(self, log_dir: str = 'logs', config_file: str = 'monitor_config.json',
+                 min_interval: float = 0.5):
         """
         初始化系统监控器
 
         Args:
             log_dir (str): 日志文件存储目录，默认为'logs'
             config_file (str): 配置文件路径，默认为'monitor_config.json'
+            min_interval (float): 最小采样间隔（秒），默认为0.5秒；监控循环的间隔不会小于它，
+                间隔内重复获取的数据直接返回上一次的结果
 
         初始化过程：
         1. 设置日志目录和配置文件路径
@@ -62,6 +148,9 @@ class SystemMonitor:
         self.log_dir = log_dir
         # 存储配置文件路径
         self.config_file = config_file
+        # 最小采样间隔，以及按名称缓存的最近一次采样结果：{名称: (采样时刻, 结果)}
+        self.min_interval = min_interval
+        self._cache = {}
         # 日志记录器实例（初始为None）
         self.logger = None
         # 加载配置文件，获取监控参数
@@ -70,8 +159,18 @@ class SystemMonitor:
         self._setup_logging()
         # 监控状态标志（False表示未开始监控）
         self.monitoring = False
+        # 停止事件：监控循环用 Event.wait(interval) 代替 time.sleep(interval)，
+        # stop_monitoring 调用 set() 后等待立即返回，无需等满一个监控间隔
+        self._stop_event = threading.Event()
         # 监控线程对象（用于多线程监控）
         self.monitor_thread = None
+        # 控制台输出队列和后台写出线程（监控期间存在，见 _start_console_writer）
+        self._console_queue = None
+        self._console_thread = None
+        # 核心数、总内存、平台等运行期间不变的系统信息，首次获取系统信息时填充
+        self._static_info = None
+        # Linux下直接读取 /proc 获取CPU和内存数据，读取失败后改用psutil
+        self._use_proc = sys.platform.startswith('linux')
 
     def _load_config(self) -> Dict[str, Any]:
         """
@@ -111,14 +210,15 @@ class SystemMonitor:
 
         # 尝试加载配置文件
         try:
-            if os.path.exists(self.config_file):
-                # 以UTF-8编码打开配置文件
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    # 解析JSON配置
-                    config = json.load(f)
-                    # 用配置文件中的值更新默认配置
-                    default_config.update(config)
-                    print(f"成功加载配置文件: {self.config_file}")
+            # 直接打开配置文件（不先用os.path.exists检查，少一次stat，也没有检查后文件被删的竞态）
+            with open(self.config_file, 'r', encoding='utf-8') as f:
+                # 解析JSON配置
+                config = json.load(f)
+                # 用配置文件中的值更新默认配置
+                default_config.update(config)
+                print(f"成功加载配置文件: {self.config_file}")
+        except FileNotFoundError:
+            pass  # 没有配置文件时使用默认配置
         except Exception as e:
             # 如果配置文件加载失败，使用默认配置并记录错误
             print(f"加载配置文件失败，使用默认配置: {e}")
@@ -140,28 +240,34 @@ class SystemMonitor:
         - 时间格式：YYYY-MM-DD HH:MM:SS
         - 文件输出：logs/system_monitor_YYYYMMDD.log
         - 控制台输出：实时显示日志信息
+        - 写入方式：记录器只挂一个QueueHandler，监控循环记日志只是入队，
+          真正的文件/控制台写入由QueueListener后台线程完成
         - 编码：UTF-8（支持中文）
         """
         # 如果日志记录器已经存在，直接返回（避免重复配置）
         if self.logger is not None:
             return self.logger
 
-        # 创建日志目录（如果不存在）
-        if not os.path.exists(self.log_dir):
-            os.makedirs(self.log_dir)
-            print(f"创建日志目录: {self.log_dir}")
+        # 创建日志目录（已存在时不报错，一次调用完成检查和创建，没有竞态）
+        os.makedirs(self.log_dir, exist_ok=True)
 
         # 定义日志格式
         log_format = '%(asctime)s - %(levelname)s - %(message)s'  # 时间 - 级别 - 消息
         date_format = '%Y-%m-%d %H:%M:%S'  # 时间格式：年-月-日 时:分:秒
+        # 所有处理器共用同一个格式化器
+        formatter = logging.Formatter(log_format, date_format)
 
         # 创建日志记录器实例
         self.logger = logging.getLogger('SystemMonitor')
         # 设置日志级别（从配置中读取）
         self.logger.setLevel(getattr(logging, self.config['log_level']))
 
-        # 清除现有的处理器（避免重复添加）
+        # 清除现有的处理器（避免重复添加），并停止上一个实例留下的日志监听线程
         self.logger.handlers.clear()
+        self._stop_log_listener()
+
+        # 实际执行写入的处理器，由后台监听线程调用
+        handlers = []
 
         # 添加文件处理器（如果启用文件输出）
         if self.config['enable_file_output']:
@@ -170,9 +276,8 @@ class SystemMonitor:
             # 创建文件处理器，使用UTF-8编码
             file_handler = logging.FileHandler(log_filename, encoding='utf-8')
             # 设置日志格式
-            file_handler.setFormatter(logging.Formatter(log_format, date_format))
-            # 添加到日志记录器
-            self.logger.addHandler(file_handler)
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
             print(f"日志文件输出已启用: {log_filename}")
 
         # 添加控制台处理器（如果启用控制台输出）
@@ -180,13 +285,33 @@ class SystemMonitor:
             # 创建控制台处理器
             console_handler = logging.StreamHandler()
             # 设置日志格式
-            console_handler.setFormatter(logging.Formatter(log_format, date_format))
-            # 添加到日志记录器
-            self.logger.addHandler(console_handler)
+            console_handler.setFormatter(formatter)
+            handlers.append(console_handler)
             print("控制台日志输出已启用")
 
+        # 记录器只挂一个QueueHandler，日志记录入队后立即返回，
+        # 由QueueListener后台线程依次交给上面的处理器写出
+        if handlers:
+            log_queue = queue.SimpleQueue()
+            self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+            listener.start()
+            SystemMonitor._log_listener = listener
+
         return self.logger
 
+    @classmethod
+    def _stop_log_listener(cls) -> None:
+        """
+        停止后台写日志的监听线程
+
+        QueueListener.stop() 会先写完队列中剩余的日志再退出。
+        重新配置日志时和程序退出时（通过atexit注册）调用。
+        """
+        if cls._log_listener is not None:
+            cls._log_listener.stop()
+            cls._log_listener = None
+
     def format_bytes(self, bytes_value: int) -> str:
         """
         格式化字节数为可读格式
@@ -205,19 +330,9 @@ class SystemMonitor:
             format_bytes(1048576) -> "1.00 MB"
             format_bytes(1073741824) -> "1.00 GB"
         """
-        # 定义字节单位（从小到大）
-        units = ['B', 'KB', 'MB', 'GB', 'TB']
-
-        # 遍历所有单位，找到合适的单位
-        for unit in units:
-            # 如果字节数小于1024，使用当前单位
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.2f} {unit}"
-            # 否则除以1024，继续检查下一个单位
-            bytes_value /= 1024.0
-
-        # 如果所有单位都不合适，使用PB（拍字节）
-        return f"{bytes_value:.2f} PB"
+        # 由二进制位数直接算出单位级别：每 10 位（1024倍）升一级，最高到PB
+        i = min(max((int(bytes_value).bit_length() - 1) // 10, 0), len(_BYTE_UNITS) - 1)
+        return f"{bytes_value / _UNIT_SCALES[i]:.2f} {_BYTE_UNITS[i]}"
 
     def format_speed(self, bytes_per_sec: float) -> str:
         """
@@ -237,15 +352,11 @@ class SystemMonitor:
             format_speed(1048576) -> "1.00 MB/s"
             format_speed(1073741824) -> "1.00 GB/s"
         """
-        # 根据速度大小选择合适的单位
-        if bytes_per_sec >= 1024 ** 3:  # 大于等于1GB/s
-            return f"{bytes_per_sec / (1024 ** 3):.2f} GB/s"
-        elif bytes_per_sec >= 1024 ** 2:  # 大于等于1MB/s
-            return f"{bytes_per_sec / (1024 ** 2):.2f} MB/s"
-        elif bytes_per_sec >= 1024:  # 大于等于1KB/s
-            return f"{bytes_per_sec / 1024:.2f} KB/s"
-        else:  # 小于1KB/s，使用字节/秒
+        # 与format_bytes相同，按二进制位数选择单位，最高到GB/s
+        i = min(max((int(bytes_per_sec).bit_length() - 1) // 10, 0), len(_SPEED_UNITS) - 1)
+        if i == 0:  # 小于1KB/s，使用字节/秒
             return f"{bytes_per_sec:.0f} B/s"
+        return f"{bytes_per_sec / _UNIT_SCALES[i]:.2f} {_SPEED_UNITS[i]}"
 
     def get_system_info(self) -> Dict[str, Any]:
         """
@@ -265,22 +376,22 @@ class SystemMonitor:
         - python_version: Python版本信息
         """
         try:
-            # 获取CPU核心数（包括逻辑核心）
-            cpu_count = psutil.cpu_count(logical=True)
-
-            # 获取CPU频率信息
-            cpu_freq = psutil.cpu_freq()
-
-            # 获取内存信息
-            memory = psutil.virtual_memory()
+            # 运行期间不会变化的信息只获取一次
+            if self._static_info is None:
+                self._static_info = {
+                    'cpu_count': psutil.cpu_count(logical=True),  # CPU核心数（包括逻辑核心）
+                    'memory_total': psutil.virtual_memory().total,  # 总内存（字节）
+                    'platform': sys.platform,  # 操作系统平台
+                    'python_version': sys.version  # Python版本
+                }
+
+            # 获取CPU频率信息（当前频率会随负载变化，超过最小采样间隔才重新获取）
+            cpu_freq = self._cached('cpu_freq', psutil.cpu_freq)
 
             # 构建系统信息字典
             system_info = {
-                'cpu_count': cpu_count,  # CPU核心数
                 'cpu_freq': cpu_freq.current if cpu_freq else 0,  # CPU频率（MHz）
-                'memory_total': memory.total,  # 总内存（字节）
-                'platform': psutil.sys.platform,  # 操作系统平台
-                'python_version': psutil.sys.version  # Python版本
+                **self._static_info  # 核心数、总内存、平台、Python版本
             }
 
             return system_info
@@ -290,15 +401,121 @@ class SystemMonitor:
             self.logger.error(f"获取系统信息失败: {e}")
             return {}
 
-    def monitor_cpu_usage(self, interval: float = None) -> None:
+    def _cached(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        限制采样频率：距上次调用不足 min_interval 时直接返回上一次的结果
+
+        外部调用方频繁轮询时，不会每次都重新读取系统数据。
+
+        Args:
+            key (str): 缓存名称
+            fn (Callable): 实际执行采样的函数
+
+        Returns:
+            Any: 采样结果
+        """
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and now - entry[0] < self.min_interval:
+            return entry[1]
+        result = fn()
+        self._cache[key] = (now, result)
+        return result
+
+    def _start_console_writer(self) -> Callable[..., None]:
+        """
+        启动后台控制台写出线程
+
+        监控循环只把要输出的文本放入队列，由后台线程一次取出队列中的全部文本，
+        合并为一次 sys.stdout.write 并刷新，不在采集线程中逐行写控制台。
+
+        Returns:
+            Callable[..., None]: 与print用法相同的输出函数（支持sep和end参数）
+        """
+        self._console_queue = console_queue = queue.SimpleQueue()
+        self._console_thread = threading.Thread(target=self._console_writer_loop, args=(console_queue,),
+                                                name="console-writer", daemon=True)
+        self._console_thread.start()
+        put = console_queue.put
+
+        def out(*args, sep: str = ' ', end: str = '\n') -> None:
+            put(sep.join(map(str, args)) + end)
+
+        return out
+
+    def _stop_console_writer(self) -> None:
+        """
+        停止后台控制台写出线程，返回前队列中的文本已全部写出
+        """
+        if self._console_thread is None:
+            return
+        self._console_queue.put(None)  # None为结束信号
+        self._console_thread.join()
+        self._console_queue = None
+        self._console_thread = None
+
+    @staticmethod
+    def _console_writer_loop(console_queue: "queue.SimpleQueue") -> None:
+        """
+        后台写出线程：阻塞等待第一段文本，再取出队列中已有的其余文本，一次写出
+
+        Args:
+            console_queue (queue.SimpleQueue): 待输出文本的队列，收到None时写完剩余文本后退出
+        """
+        get, get_nowait = console_queue.get, console_queue.get_nowait
+        while True:
+            batch = [get()]
+            while True:
+                try:
+                    batch.append(get_nowait())
+                except queue.Empty:
+                    break
+            done = None in batch
+            if done:
+                batch = batch[:batch.index(None)]
+            if batch:
+                sys.stdout.write(''.join(batch))
+                sys.stdout.flush()
+            if done:
+                return
+
+    def _wait_next_tick(self, deadline: float, interval: float) -> Optional[float]:
+        """
+        等待到下一个采样截止时刻
+
+        截止时刻按 time.monotonic() 每次累加 interval，采样本身的耗时不会
+        累积到周期里；如果一轮处理已经超过截止时刻，则以当前时刻重新对齐，
+        不会为了追赶而连续采样。间隔小于 min_interval 时按 min_interval 计算。
+
+        Args:
+            deadline (float): 上一个截止时刻（time.monotonic() 时间）
+            interval (float): 监控间隔时间（秒）
+
+        Returns:
+            Optional[float]: 新的截止时刻；收到停止信号时返回None
+        """
+        deadline += max(interval, self.min_interval)
+        now = time.monotonic()
+        if deadline < now:
+            deadline = now
+        # 收到停止信号时立即返回
+        if self._stop_event.wait(deadline - now):
+            return None
+        return deadline
+
+    def monitor_cpu_usage(self, interval: float = None, report_interval: float = None) -> None:
         """
         实时监控CPU占用率
 
         持续监控系统CPU的使用情况，包括总体使用率和每个核心的详细使用率。
         当CPU使用率超过配置的阈值时，会记录警告日志。
 
+        采样和汇报可以使用不同的间隔：每个 interval 采样一次（非阻塞，开销很小），
+        每个 report_interval 才输出、记录一次这段时间的平均值和P95，并按平均值检查阈值。
+
         Args:
-            interval (float, optional): 监控间隔时间（秒），如果为None则使用配置文件中的值
+            interval (float, optional): 采样间隔时间（秒），如果为None则使用配置文件中的值
+            report_interval (float, optional): 汇报间隔时间（秒），如果为None则每次采样都汇报
 
         监控内容：
         - CPU总体使用率（百分比）
@@ -317,51 +534,111 @@ class SystemMonitor:
         # 记录开始监控的日志
         self.logger.info("开始CPU监控")
 
+        # 循环开始前判断一次INFO级别是否启用；未启用时每个周期不再构造日志参数，
+        # 启用时由日志监听线程按 % 格式化，采集线程只传递原始数值
+        info_enabled = self.logger.isEnabledFor(logging.INFO)
+
+        # 控制台输出交给后台线程批量写出，方法结束前等待全部写出
+        out = self._start_console_writer()
+
         try:
             # 显示监控开始信息
-            print("开始监控CPU占用率")
-            print("按 Ctrl+C 停止监控")
-            print("-" * 50)  # 分隔线
+            out("开始监控CPU占用率")
+            out("按 Ctrl+C 停止监控")
+            out("-" * 50)  # 分隔线
 
-            # 主监控循环
-            while self.monitoring:
-                # 获取CPU总体使用率（指定间隔时间内的平均值）
-                cpu_percent = psutil.cpu_percent(interval=interval)
+            # 获取CPU核心数量（逻辑核心，运行期间不变，循环外只获取一次）
+            core_count = psutil.cpu_count(logical=True)
 
-                # 获取CPU核心数量（逻辑核心）
-                core_count = psutil.cpu_count(logical=True)
+            # 每汇报一次包含的采样次数，以及汇报周期内的总体使用率和各核心使用率累计值
+            report_every = max(1, round(report_interval / max(interval, self.min_interval))) if report_interval else 1
+            totals = deque(maxlen=report_every)
+            core_sums = None
 
-                # 获取每个核心的使用率
-                per_cpu = psutil.cpu_percent(interval=interval, percpu=True)
+            # 先以非阻塞方式调用一次作为基准，之后每次调用返回距上次调用期间的使用率
+            psutil.cpu_percent(interval=None, percpu=True)
 
-                # 格式化输出总体CPU使用率
-                print(f"CPU总占用率: {cpu_percent:5.1f}% | 核心数: {core_count}")
+            # 循环中用到的方法、函数和阈值绑定为局部变量，每个周期省去属性和字典查找
+            cpu_percent_fn = psutil.cpu_percent
+            log_info, log_warn = self.logger.info, self.logger.warning
+            wait_next_tick = self._wait_next_tick
+            warn_threshold = self.config['cpu_warning_threshold']
 
-                # 显示每个核心的使用率
-                print("各核心占用率:", end=" ")
-                for i, core in enumerate(per_cpu):
-                    # 格式化每个核心的使用率，最后一个核心不添加分隔符
-                    print(f"核心{i}: {core:3.0f}%", end=" | " if i < len(per_cpu) - 1 else "")
-                print()  # 换行
+            deadline = time.monotonic()
+
+            # 主监控循环：按截止时刻等待，周期固定为 interval，不随处理耗时漂移
+            while self.monitoring:
+                deadline = wait_next_tick(deadline, interval)
+                if deadline is None:
+                    break
+
+                # 获取每个核心的使用率（上一次采样至今的平均值，不阻塞）
+                per_cpu = cpu_percent_fn(interval=None, percpu=True)
+
+                # 总体使用率取各核心的平均值：只采样一次，循环周期不再是两个间隔，
+                # 总体和各核心的数据也来自同一个时间窗口
+                cpu_percent = sum(per_cpu) / len(per_cpu) if per_cpu else 0.0
+
+                # 未到汇报时刻时只累计采样值
+                totals.append(cpu_percent)
+                core_sums = per_cpu if core_sums is None else [a + b for a, b in zip(core_sums, per_cpu)]
+                if len(totals) < report_every:
+                    continue
+
+                # 汇报这段时间的平均值（每次采样都汇报时就是本次采样值）
+                if report_every > 1:
+                    cpu_percent = sum(totals) / report_every
+                    per_cpu = [core / report_every for core in core_sums]
+                    p95_text = f" | P95: {statistics.quantiles(totals, n=20, method='inclusive')[-1]:5.1f}%"
+                else:
+                    p95_text = ""
+                totals.clear()
+                core_sums = None
+
+                # 总体使用率与各核心使用率拼成一段文本，一次放入输出队列（不再逐核心调用print）
+                cores_line = " | ".join(f"核心{i}: {core:3.0f}%" for i, core in enumerate(per_cpu))
+                out(f"CPU总占用率: {cpu_percent:5.1f}%{p95_text} | 核心数: {core_count}\n"
+                    f"各核心占用率: {cores_line}")
 
                 # 记录CPU使用率到日志文件
-                self.logger.info(f"CPU使用率: {cpu_percent:.1f}%")
+                if info_enabled:
+                    log_info("CPU使用率: %.1f%%", cpu_percent)
 
                 # 检查CPU使用率是否超过警告阈值
-                if cpu_percent > self.config['cpu_warning_threshold']:
-                    self.logger.warning(f"CPU使用率过高: {cpu_percent:.1f}%")
-
-                # 短暂休眠，减轻CPU循环压力
-                time.sleep(0.1)
+                if cpu_percent > warn_threshold:
+                    log_warn("CPU使用率过高: %.1f%%", cpu_percent)
 
         except KeyboardInterrupt:
             # 用户按Ctrl+C停止监控
             self.logger.info("CPU监控已停止")
-            print("\nCPU监控已停止")
+            out("\nCPU监控已停止")
         except Exception as e:
             # 监控过程中出现异常
             self.logger.error(f"CPU监控出错: {str(e)}")
-            print(f"\n监控出错: {str(e)}")
+            out(f"\n监控出错: {str(e)}")
+        finally:
+            self._stop_console_writer()
+
+    def _read_meminfo_fast(self) -> Optional[Tuple[int, int, int, float]]:
+        """
+        直接读取 /proc/meminfo 获取内存信息（仅Linux）
+
+        只解析需要的字段，按psutil相同的公式计算（已用 = 总量 - 可用），
+        不构造 psutil.virtual_memory() 的完整结果。
+
+        Returns:
+            Optional[Tuple[int, int, int, float]]: (总内存, 已用内存, 可用内存, 内存使用率)，
+            容量单位为字节；非Linux或读取失败时返回None，并且之后不再尝试 /proc
+        """
+        if not self._use_proc:
+            return None
+        try:
+            total, available = _parse_meminfo(_read_proc_head(_PROC_MEMINFO))
+        except (OSError, ValueError, KeyError, IndexError):
+            self._use_proc = False
+            return None
+        used = total - available
+        return total, used, available, round(used / total * 100, 1) if total else 0.0
 
     def monitor_memory_usage(self, interval: float = None) -> None:
         """
@@ -391,47 +668,84 @@ class SystemMonitor:
         # 记录开始监控的日志
         self.logger.info("开始内存监控")
 
+        # 循环开始前判断一次INFO级别是否启用；未启用时每个周期不再构造日志参数，
+        # 启用时由日志监听线程按 % 格式化，采集线程只传递原始数值
+        info_enabled = self.logger.isEnabledFor(logging.INFO)
+
+        # 控制台输出交给后台线程批量写出，方法结束前等待全部写出
+        out = self._start_console_writer()
+
         try:
             # 显示监控开始信息
-            print("开始监控内存使用情况")
-            print("按 Ctrl+C 停止监控")
-            print("-" * 50)  # 分隔线
+            out("开始监控内存使用情况")
+            out("按 Ctrl+C 停止监控")
+            out("-" * 50)  # 分隔线
+
+            # 循环中用到的方法、函数和阈值绑定为局部变量，每个周期省去属性和字典查找
+            read_meminfo = self._read_meminfo_fast
+            virtual_memory = psutil.virtual_memory
+            log_info, log_warn = self.logger.info, self.logger.warning
+            wait_next_tick = self._wait_next_tick
+            warn_threshold = self.config['memory_warning_threshold']
+
+            deadline = time.monotonic()
 
             # 主监控循环
             while self.monitoring:
-                # 获取系统内存信息
-                memory = psutil.virtual_memory()
+                # 获取系统内存信息（Linux下直接读取 /proc/meminfo，否则使用psutil）
+                mem = read_meminfo()
+                if mem is None:
+                    memory = virtual_memory()
+                    mem = (memory.total, memory.used, memory.available, memory.percent)
+                mem_total, mem_used, mem_available, memory_percent = mem
 
                 # 计算内存使用情况的各个指标
-                total_gb = memory.total / (1024 ** 3)  # 总内存（GB）
-                used_gb = memory.used / (1024 ** 3)  # 已使用内存（GB）
-                available_gb = memory.available / (1024 ** 3)  # 可用内存（GB）
-                memory_percent = memory.percent  # 内存使用率（百分比）
+                total_gb = mem_total / (1024 ** 3)  # 总内存（GB）
+                used_gb = mem_used / (1024 ** 3)  # 已使用内存（GB）
+                available_gb = mem_available / (1024 ** 3)  # 可用内存（GB）
 
                 # 格式化输出内存使用情况
-                print(f"内存使用率: {memory_percent:5.1f}% | "
+                out(f"内存使用率: {memory_percent:5.1f}% | "
                       f"总量: {total_gb:6.1f}GB | "
                       f"已用: {used_gb:6.1f}GB | "
                       f"可用: {available_gb:6.1f}GB")
 
                 # 记录内存使用情况到日志文件
-                self.logger.info(f"内存使用率: {memory_percent:.1f}%, 已用: {used_gb:.1f}GB/{total_gb:.1f}GB")
+                if info_enabled:
+                    log_info("内存使用率: %.1f%%, 已用: %.1fGB/%.1fGB", memory_percent, used_gb, total_gb)
 
                 # 检查内存使用率是否超过警告阈值
-                if memory_percent > self.config['memory_warning_threshold']:
-                    self.logger.warning(f"内存使用率过高: {memory_percent:.1f}%")
+                if memory_percent > warn_threshold:
+                    log_warn("内存使用率过高: %.1f%%", memory_percent)
 
-                # 按配置的间隔时间休眠
-                time.sleep(interval)
+                # 等到下一个截止时刻（收到停止信号时立即退出）
+                deadline = wait_next_tick(deadline, interval)
+                if deadline is None:
+                    break
 
         except KeyboardInterrupt:
             # 用户按Ctrl+C停止监控
             self.logger.info("内存监控已停止")
-            print("\n内存监控已停止")
+            out("\n内存监控已停止")
         except Exception as e:
             # 监控过程中出现异常
             self.logger.error(f"内存监控出错: {str(e)}")
-            print(f"\n监控出错: {str(e)}")
+            out(f"\n监控出错: {str(e)}")
+        finally:
+            self._stop_console_writer()
+
+    def _scan_active_interfaces(self) -> List[str]:
+        """
+        扫描活跃的网络接口
+
+        Returns:
+            List[str]: 带有非回环IPv4地址（非127.x.x.x）的接口名称列表
+        """
+        return [
+            interface
+            for interface, addrs in psutil.net_if_addrs().items()
+            if any(addr.family == socket.AF_INET and not addr.address.startswith('127.') for addr in addrs)
+        ]
 
     def monitor_network_speed(self, interval: float = None) -> None:
         """
@@ -468,32 +782,55 @@ class SystemMonitor:
         # 记录开始监控的日志
         self.logger.info("开始网络速度监控")
 
+        # 循环开始前判断一次INFO级别是否启用；未启用时每个周期不再构造日志参数，
+        # 启用时由日志监听线程按 % 格式化，采集线程只传递原始数值
+        info_enabled = self.logger.isEnabledFor(logging.INFO)
+
+        # 控制台输出交给后台线程批量写出，方法结束前等待全部写出
+        out = self._start_console_writer()
+
         try:
             # 显示监控开始信息
-            print("开始监控网络速度")
-            print("正在初始化网络统计...")
-            print("按 Ctrl+C 停止监控")
-            print("-" * 50)  # 分隔线
+            out("开始监控网络速度")
+            out("正在初始化网络统计...")
+            out("按 Ctrl+C 停止监控")
+            out("-" * 50)  # 分隔线
 
             # 获取初始网络统计信息
             net_io = psutil.net_io_counters()
             last_bytes_sent = net_io.bytes_sent  # 初始发送字节数
             last_bytes_recv = net_io.bytes_recv  # 初始接收字节数
-            last_time = time.time()  # 初始时间戳
+            last_time = time.monotonic()  # 初始时间戳（单调时钟，不受系统校时影响）
+
+            # 活跃接口几乎不会变化，每隔 IFACE_REFRESH_SECONDS 秒才重新扫描一次
+            active_interfaces = self._scan_active_interfaces()
+            ifaces_refreshed_at = time.monotonic()
 
             # 记录初始化完成日志
             self.logger.info("网络统计初始化完成")
 
-            # 等待一个间隔时间，为第一次速度计算做准备
-            time.sleep(interval)
+            # 循环中用到的方法、函数和阈值绑定为局部变量，每个周期省去属性和字典查找
+            net_io_counters = psutil.net_io_counters
+            monotonic = time.monotonic
+            format_speed = self.format_speed
+            log_info, log_warn = self.logger.info, self.logger.warning
+            wait_next_tick = self._wait_next_tick
+            refresh_seconds = self.IFACE_REFRESH_SECONDS
+            warn_speed = self.config['network_speed_warning']
 
-            # 主监控循环
+            deadline = last_time
+
+            # 主监控循环：先等到截止时刻再采样，第一次等待为速度计算做准备
             while self.monitoring:
+                deadline = wait_next_tick(deadline, interval)
+                if deadline is None:
+                    break
+
                 # 获取当前网络统计信息
-                net_io = psutil.net_io_counters()
+                net_io = net_io_counters()
                 current_bytes_sent = net_io.bytes_sent  # 当前发送字节数
                 current_bytes_recv = net_io.bytes_recv  # 当前接收字节数
-                current_time = time.time()  # 当前时间戳
+                current_time = monotonic()  # 当前时间戳
 
                 # 计算时间差和字节差
                 time_diff = current_time - last_time  # 时间差（秒）
@@ -504,51 +841,99 @@ class SystemMonitor:
                 upload_speed = bytes_sent_diff / time_diff  # 上传速度
                 download_speed = bytes_recv_diff / time_diff  # 下载速度
 
-                # 获取网络接口信息
-                net_if_addrs = psutil.net_if_addrs()
-                active_interfaces = []
-
-                # 遍历所有网络接口，找到活跃的IPv4接口
-                for interface, addrs in net_if_addrs.items():
-                    for addr in addrs:
-                        # 检查是否为IPv4地址且不是本地回环地址（127.x.x.x）
-                        if (hasattr(addr, 'family') and
-                                addr.family == 2 and
-                                not addr.address.startswith('127.')):
-                            active_interfaces.append(interface)
-                            break
-
-                # 格式化输出网络速度
-                print(f"上传速度: {self.format_speed(upload_speed):>10} | "
-                      f"下载速度: {self.format_speed(download_speed):>10} | "
+                # 到达刷新周期时重新扫描活跃接口
+                if current_time - ifaces_refreshed_at >= refresh_seconds:
+                    active_interfaces = self._scan_active_interfaces()
+                    ifaces_refreshed_at = monotonic()
+
+                # 格式化输出网络速度（格式化后的文本在输出和日志中复用）
+                upload_text = format_speed(upload_speed)
+                download_text = format_speed(download_speed)
+                out(f"上传速度: {upload_text:>10} | "
+                      f"下载速度: {download_text:>10} | "
                       f"活跃接口: {', '.join(active_interfaces[:2])}")
 
                 # 记录网络速度到日志文件
-                self.logger.info(
-                    f"网络速度 - 上传: {self.format_speed(upload_speed)}, 下载: {self.format_speed(download_speed)}")
+                if info_enabled:
+                    log_info("网络速度 - 上传: %s, 下载: %s", upload_text, download_text)
 
                 # 检查网络速度是否超过警告阈值
-                if upload_speed > self.config['network_speed_warning'] or download_speed > self.config[
-                    'network_speed_warning']:
-                    self.logger.warning(
-                        f"网络速度异常 - 上传: {self.format_speed(upload_speed)}, 下载: {self.format_speed(download_speed)}")
+                if upload_speed > warn_speed or download_speed > warn_speed:
+                    log_warn("网络速度异常 - 上传: %s, 下载: %s", upload_text, download_text)
 
                 # 更新上一次的值，为下次计算做准备
                 last_bytes_sent = current_bytes_sent
                 last_bytes_recv = current_bytes_recv
                 last_time = current_time
 
-                # 按配置的间隔时间休眠
-                time.sleep(interval)
-
         except KeyboardInterrupt:
             # 用户按Ctrl+C停止监控
             self.logger.info("网络速度监控已停止")
-            print("\n网络速度监控已停止")
+            out("\n网络速度监控已停止")
         except Exception as e:
             # 监控过程中出现异常
             self.logger.error(f"网络速度监控出错: {str(e)}")
-            print(f"\n监控出错: {str(e)}")
+            out(f"\n监控出错: {str(e)}")
+        finally:
+            self._stop_console_writer()
+
+    def _build_collector(self) -> Callable[[], Tuple[float, int, int, float]]:
+        """
+        按平台选出系统资源的采集函数
+
+        平台在监控开始时就已确定，这里只判断一次，返回的函数在每个周期
+        直接调用，循环中不再判断平台；用到的函数都预先绑定为局部变量。
+        Linux下读取 /proc/stat 和 /proc/meminfo（每个文件一次 open/read/close），
+        按psutil相同的公式计算CPU使用率和已用内存（已用 = 总量 - 可用）；
+        其他平台或 /proc 读取失败后使用psutil。
+
+        创建时会记录一次CPU时间作为基准，之后每次调用返回距上次调用期间的平均CPU使用率。
+
+        Returns:
+            Callable: 每次调用返回 (CPU使用率, 总内存字节数, 已用内存字节数, 内存使用率)
+        """
+        cpu_percent = psutil.cpu_percent
+        virtual_memory = psutil.virtual_memory
+
+        def collect_psutil() -> Tuple[float, int, int, float]:
+            memory = virtual_memory()
+            return cpu_percent(interval=None), memory.total, memory.used, memory.percent
+
+        # psutil总是取一次基准，/proc 不可用时可以直接切换
+        cpu_percent(interval=None)
+        if not self._use_proc:
+            return collect_psutil
+
+        read_head = _read_proc_head
+        parse_cpu_times = _parse_cpu_times
+        parse_meminfo = _parse_meminfo
+        try:
+            last_times = parse_cpu_times(read_head(_PROC_STAT, 4096))
+        except (OSError, ValueError, IndexError):
+            self._use_proc = False
+            return collect_psutil
+
+        def collect_proc() -> Tuple[float, int, int, float]:
+            nonlocal last_times
+            if not self._use_proc:
+                return collect_psutil()
+            try:
+                total, idle = times = parse_cpu_times(read_head(_PROC_STAT, 4096))
+                mem_total, mem_available = parse_meminfo(read_head(_PROC_MEMINFO))
+                mem_used = mem_total - mem_available
+            except (OSError, ValueError, KeyError, IndexError):
+                # 读取失败后本次及之后都改用psutil
+                self._use_proc = False
+                return collect_psutil()
+
+            total_diff = total - last_times[0]
+            busy_diff = total_diff - (idle - last_times[1])
+            last_times = times
+            cpu = round(min(max(busy_diff / total_diff * 100, 0.0), 100.0), 1) if total_diff > 0 else 0.0
+            mem_percent = round(mem_used / mem_total * 100, 1) if mem_total else 0.0
+            return cpu, mem_total, mem_used, mem_percent
+
+        return collect_proc
 
     def monitor_system_resources(self, interval: float = None) -> None:
         """
@@ -582,64 +967,98 @@ class SystemMonitor:
         # 记录开始监控的日志
         self.logger.info("开始系统资源综合监控")
 
+        # 循环开始前判断一次INFO级别是否启用；未启用时每个周期不再构造日志参数，
+        # 启用时由日志监听线程按 % 格式化，采集线程只传递原始数值
+        info_enabled = self.logger.isEnabledFor(logging.INFO)
+
+        # 控制台输出交给后台线程批量写出，方法结束前等待全部写出
+        out = self._start_console_writer()
+
         try:
             # 显示监控开始信息
-            print("开始监控系统资源使用情况")
-            print("按 Ctrl+C 停止监控")
-            print("=" * 80)  # 分隔线
-
-            # 主监控循环
+            out("开始监控系统资源使用情况")
+            out("按 Ctrl+C 停止监控")
+            out("=" * 80)  # 分隔线
+
+            # 按平台选出采集函数（同时记录CPU时间基准），循环中直接调用
+            collect = self._build_collector()
+            disk_usage = psutil.disk_usage
+
+            # 磁盘总容量基本不变，只在开始时读取一次；读取失败时保持为None，在循环中重试
+            disk_total = None
+            disk_total_gb = 0
+            try:
+                disk_total = psutil.disk_usage('/').total
+                disk_total_gb = disk_total / (1024 ** 3)  # 总磁盘空间（GB）
+            except Exception as e:
+                self.logger.warning("无法获取磁盘信息: %s", e)
+
+            # 循环中用到的方法、函数和阈值绑定为局部变量，每个周期省去属性和字典查找
+            log_info, log_warn = self.logger.info, self.logger.warning
+            wait_next_tick = self._wait_next_tick
+            cpu_threshold = self.config['cpu_warning_threshold']
+            memory_threshold = self.config['memory_warning_threshold']
+            disk_threshold = self.config['disk_warning_threshold']
+
+            deadline = time.monotonic()
+
+            # 主监控循环：先等到截止时刻再采样，整个周期只等待一次
             while self.monitoring:
-                # 获取CPU使用率（指定间隔时间内的平均值）
-                cpu_percent = psutil.cpu_percent(interval=interval)
+                # 按截止时刻等待（收到停止信号时立即退出）
+                deadline = wait_next_tick(deadline, interval)
+                if deadline is None:
+                    break
 
-                # 获取内存信息
-                memory = psutil.virtual_memory()
-                memory_percent = memory.percent  # 内存使用率（百分比）
-                total_gb = memory.total / (1024 ** 3)  # 总内存（GB）
-                used_gb = memory.used / (1024 ** 3)  # 已使用内存（GB）
+                # 获取CPU使用率（上一次采样至今的平均值，不阻塞）和内存信息
+                cpu_percent, mem_total, mem_used, memory_percent = collect()
+                total_gb = mem_total / (1024 ** 3)  # 总内存（GB）
+                used_gb = mem_used / (1024 ** 3)  # 已使用内存（GB）
 
-                # 获取磁盘使用情况（可能因权限问题失败）
+                # 获取磁盘使用情况（可能因权限问题失败），总容量沿用缓存的值，尚未读到时一并读取
                 try:
-                    disk = psutil.disk_usage('/')  # 获取根目录磁盘使用情况
-                    disk_percent = (disk.used / disk.total) * 100  # 磁盘使用率（百分比）
-                    disk_total_gb = disk.total / (1024 ** 3)  # 总磁盘空间（GB）
-                    disk_used_gb = disk.used / (1024 ** 3)  # 已使用磁盘空间（GB）
+                    if disk_total is None:
+                        usage = disk_usage('/')
+                        disk_total = usage.total
+                        disk_total_gb = disk_total / (1024 ** 3)
+                        disk_used = usage.used
+                    else:
+                        disk_used = disk_usage('/').used  # 根目录已使用空间
+                    disk_percent = (disk_used / disk_total) * 100 if disk_total else 0  # 磁盘使用率（百分比）
+                    disk_used_gb = disk_used / (1024 ** 3)  # 已使用磁盘空间（GB）
                 except Exception as e:
                     # 如果无法获取磁盘信息，记录警告并使用默认值
-                    self.logger.warning(f"无法获取磁盘信息: {str(e)}")
+                    log_warn("无法获取磁盘信息: %s", e)
                     disk_percent = 0
-                    disk_total_gb = 0
                     disk_used_gb = 0
 
                 # 格式化输出所有资源使用情况（单行显示）
-                print(f"CPU: {cpu_percent:5.1f}% | "
+                out(f"CPU: {cpu_percent:5.1f}% | "
                       f"内存: {memory_percent:5.1f}% ({used_gb:5.1f}GB/{total_gb:5.1f}GB) | "
                       f"磁盘: {disk_percent:5.1f}% ({disk_used_gb:5.1f}GB/{disk_total_gb:5.1f}GB)")
 
                 # 记录系统资源使用情况到日志文件
-                self.logger.info(
-                    f"系统资源 - CPU: {cpu_percent:.1f}%, 内存: {memory_percent:.1f}%, 磁盘: {disk_percent:.1f}%")
+                if info_enabled:
+                    log_info("系统资源 - CPU: %.1f%%, 内存: %.1f%%, 磁盘: %.1f%%",
+                             cpu_percent, memory_percent, disk_percent)
 
                 # 检查各个资源的警告阈值
-                if cpu_percent > self.config['cpu_warning_threshold']:
-                    self.logger.warning(f"CPU使用率过高: {cpu_percent:.1f}%")
-                if memory_percent > self.config['memory_warning_threshold']:
-                    self.logger.warning(f"内存使用率过高: {memory_percent:.1f}%")
-                if disk_percent > self.config['disk_warning_threshold']:
-                    self.logger.warning(f"磁盘使用率过高: {disk_percent:.1f}%")
-
-                # 按配置的间隔时间休眠
-                time.sleep(interval)
+                if cpu_percent > cpu_threshold:
+                    log_warn("CPU使用率过高: %.1f%%", cpu_percent)
+                if memory_percent > memory_threshold:
+                    log_warn("内存使用率过高: %.1f%%", memory_percent)
+                if disk_percent > disk_threshold:
+                    log_warn("磁盘使用率过高: %.1f%%", disk_percent)
 
         except KeyboardInterrupt:
             # 用户按Ctrl+C停止监控
             self.logger.info("系统资源监控已停止")
-            print("\n系统资源监控已停止")
+            out("\n系统资源监控已停止")
         except Exception as e:
             # 监控过程中出现异常
             self.logger.error(f"系统资源监控出错: {str(e)}")
-            print(f"\n监控出错: {str(e)}")
+            out(f"\n监控出错: {str(e)}")
+        finally:
+            self._stop_console_writer()
 
     def monitor_running_applications(self, interval: float = None, top_n: int = 10) -> None:
         """
@@ -649,16 +1068,28 @@ class SystemMonitor:
             interval = self.config['monitor_interval']
 
         self.logger.info("开始应用程序监控")
+        info_enabled = self.logger.isEnabledFor(logging.INFO)  # 循环前判断一次INFO级别是否启用
 
-        try:
-            print("开始监控运行中的应用程序")
-            print("按 Ctrl+C 停止监控")
-            print("=" * 80)
+        # 控制台输出交给后台线程批量写出，方法结束前等待全部写出
+        out = self._start_console_writer()
 
+        try:
+            out("开始监控运行中的应用程序")
+            out("按 Ctrl+C 停止监控")
+            out("=" * 80)
+
+            # 循环中用到的方法、函数和阈值绑定为局部变量
+            process_iter = psutil.process_iter
+            log_info, log_warn = self.logger.info, self.logger.warning
+            wait_next_tick = self._wait_next_tick
+            cpu_threshold = self.config['process_cpu_warning']
+            memory_threshold = self.config['process_memory_warning']
+
+            deadline = time.monotonic()
             while self.monitoring:
                 # 获取所有进程
                 processes = []
-                for proc in psutil.process_iter(
+                for proc in process_iter(
                         ['pid', 'name', 'cpu_percent', 'memory_percent', 'memory_info', 'status']):
                     try:
                         proc_info = proc.info
@@ -667,17 +1098,17 @@ class SystemMonitor:
                     except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                         continue
 
-                # 按CPU使用率排序
-                processes.sort(key=lambda x: x['cpu_percent'], reverse=True)
+                # 按CPU使用率选出前N个进程（堆选择为 O(P log N)，不必对全部进程排序）
+                top_processes = heapq.nlargest(top_n, processes, key=itemgetter('cpu_percent'))
 
-                print(f"\n时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                print(f"总进程数: {len(processes)}")
-                print("-" * 80)
-                print(f"{'PID':<8} {'进程名':<20} {'CPU%':<8} {'内存%':<8} {'内存(MB)':<12} {'状态':<8}")
-                print("-" * 80)
+                out(f"\n时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+                out(f"总进程数: {len(processes)}")
+                out("-" * 80)
+                out(f"{'PID':<8} {'进程名':<20} {'CPU%':<8} {'内存%':<8} {'内存(MB)':<12} {'状态':<8}")
+                out("-" * 80)
 
                 # 显示前N个进程
-                for i, proc in enumerate(processes[:top_n]):
+                for i, proc in enumerate(top_processes):
                     try:
                         pid = proc['pid']
                         name = proc['name'][:18] if proc['name'] else 'Unknown'
@@ -686,30 +1117,34 @@ class SystemMonitor:
                         memory_mb = proc['memory_info'].rss / (1024 * 1024) if proc['memory_info'] else 0
                         status = proc['status']
 
-                        print(
+                        out(
                             f"{pid:<8} {name:<20} {cpu_percent:<8.1f} {memory_percent:<8.1f} {memory_mb:<12.1f} {status:<8}")
 
                         # 记录高资源占用进程
-                        if cpu_percent > self.config['process_cpu_warning'] or memory_percent > self.config[
-                            'process_memory_warning']:
-                            self.logger.warning(
-                                f"高资源占用进程 - PID: {pid}, 名称: {name}, CPU: {cpu_percent:.1f}%, 内存: {memory_percent:.1f}%")
+                        if cpu_percent > cpu_threshold or memory_percent > memory_threshold:
+                            log_warn("高资源占用进程 - PID: %s, 名称: %s, CPU: %.1f%%, 内存: %.1f%%",
+                                     pid, name, cpu_percent, memory_percent)
 
                     except Exception as e:
                         continue
 
                 # 记录日志
-                self.logger.info(f"当前运行进程数: {len(processes)}")
+                if info_enabled:
+                    log_info("当前运行进程数: %d", len(processes))
 
-                print("-" * 80)
-                time.sleep(interval)
+                out("-" * 80)
+                deadline = wait_next_tick(deadline, interval)
+                if deadline is None:
+                    break
 
         except KeyboardInterrupt:
             self.logger.info("应用程序监控已停止")
-            print("\n应用程序监控已停止")
+            out("\n应用程序监控已停止")
         except Exception as e:
             self.logger.error(f"应用程序监控出错: {str(e)}")
-            print(f"\n监控出错: {str(e)}")
+            out(f"\n监控出错: {str(e)}")
+        finally:
+            self._stop_console_writer()
 
     def get_detailed_process_info(self, pid: Optional[int] = None) -> None:
         """
@@ -722,22 +1157,24 @@ class SystemMonitor:
                 print(f"\n进程详细信息 - PID: {pid}")
                 print("=" * 50)
 
-                # 基本信息
-                print(f"进程名: {proc.name()}")
-                print(f"状态: {proc.status()}")
-                print(f"创建时间: {datetime.fromtimestamp(proc.create_time()).strftime('%Y-%m-%d %H:%M:%S')}")
+                # oneshot() 内多次取值共用同一次 /proc/[pid]/stat 等文件的读取结果
+                with proc.oneshot():
+                    # 基本信息
+                    print(f"进程名: {proc.name()}")
+                    print(f"状态: {proc.status()}")
+                    print(f"创建时间: {datetime.fromtimestamp(proc.create_time()).strftime('%Y-%m-%d %H:%M:%S')}")
 
-                # CPU信息
-                cpu_percent = proc.cpu_percent()
-                print(f"CPU使用率: {cpu_percent:.1f}%")
+                    # CPU信息
+                    cpu_percent = proc.cpu_percent()
+                    print(f"CPU使用率: {cpu_percent:.1f}%")
 
-                # 内存信息
-                memory_info = proc.memory_info()
-                memory_percent = proc.memory_percent()
-                print(f"内存使用: {memory_info.rss / (1024 * 1024):.1f} MB ({memory_percent:.1f}%)")
+                    # 内存信息
+                    memory_info = proc.memory_info()
+                    memory_percent = proc.memory_percent()
+                    print(f"内存使用: {memory_info.rss / (1024 * 1024):.1f} MB ({memory_percent:.1f}%)")
 
-                # 线程信息
-                print(f"线程数: {proc.num_threads()}")
+                    # 线程信息
+                    print(f"线程数: {proc.num_threads()}")
 
                 # 网络连接
                 try:
@@ -800,6 +1237,8 @@ class SystemMonitor:
 
         根据指定的监控类型启动相应的监控功能。这是一个统一的入口方法，
         支持多种监控类型，并可以传递额外的参数。
+        监控在后台线程（self.monitor_thread）中运行，本方法启动线程后立即返回；
+        需要阻塞等待时调用 wait_monitoring()，停止时调用 stop_monitoring()。
 
         Args:
             monitor_type (str): 监控类型，支持以下值：
@@ -810,36 +1249,58 @@ class SystemMonitor:
                 - "applications": 应用程序监控
             **kwargs: 传递给具体监控方法的额外参数，如：
                 - interval: 监控间隔时间
+                - report_interval: 汇报间隔时间（仅cpu类型，采样仍按interval进行）
                 - top_n: 显示前N个进程（仅applications类型）
 
         使用示例：
             monitor.start_monitoring("cpu", interval=2)
+            monitor.start_monitoring("cpu", interval=0.5, report_interval=5)
             monitor.start_monitoring("system", interval=1)
             monitor.start_monitoring("applications", top_n=20)
+            monitor.wait_monitoring()  # 阻塞到按 Ctrl+C 为止
         """
-        # 设置监控状态为True，表示开始监控
-        self.monitoring = True
-
-        # 根据监控类型调用相应的监控方法
-        if monitor_type == "cpu":
-            # CPU使用率监控
-            self.monitor_cpu_usage(**kwargs)
-        elif monitor_type == "memory":
-            # 内存使用情况监控
-            self.monitor_memory_usage(**kwargs)
-        elif monitor_type == "network":
-            # 网络速度监控
-            self.monitor_network_speed(**kwargs)
-        elif monitor_type == "system":
-            # 系统资源综合监控
-            self.monitor_system_resources(**kwargs)
-        elif monitor_type == "applications":
-            # 应用程序监控
-            self.monitor_running_applications(**kwargs)
-        else:
+        # 监控类型到监控方法的映射
+        monitors = {
+            "cpu": self.monitor_cpu_usage,  # CPU使用率监控
+            "memory": self.monitor_memory_usage,  # 内存使用情况监控
+            "network": self.monitor_network_speed,  # 网络速度监控
+            "system": self.monitor_system_resources,  # 系统资源综合监控
+            "applications": self.monitor_running_applications,  # 应用程序监控
+        }
+        target = monitors.get(monitor_type)
+        if target is None:
             # 未知的监控类型
             print(f"未知的监控类型: {monitor_type}")
             print("支持的监控类型: cpu, memory, network, system, applications")
+            return
+
+        # 同一时间只运行一个监控线程，先停止正在运行的监控
+        if self.monitor_thread and self.monitor_thread.is_alive():
+            self.stop_monitoring()
+
+        # 设置监控状态为True，表示开始监控
+        self.monitoring = True
+        self._stop_event.clear()
+
+        # 在后台线程中运行监控循环（守护线程，主程序退出时不会被它阻塞）
+        self.monitor_thread = threading.Thread(target=target, kwargs=kwargs, name=f"monitor-{monitor_type}",
+                                               daemon=True)
+        self.monitor_thread.start()
+
+    def wait_monitoring(self) -> None:
+        """
+        阻塞等待后台监控线程结束
+
+        按 Ctrl+C 时停止监控并返回。KeyboardInterrupt 只会发送到主线程，
+        所以由这里捕获后通知监控线程退出。
+        """
+        try:
+            # 在停止事件上带超时地循环等待，保证各平台上都能及时响应 Ctrl+C；
+            # 不在 join() 中等待，因为 join 被 Ctrl+C 打断后线程可能被误标记为已结束
+            while self.monitor_thread and self.monitor_thread.is_alive():
+                self._stop_event.wait(0.5)
+        except KeyboardInterrupt:
+            self.stop_monitoring()
 
     def stop_monitoring(self) -> None:
         """
@@ -853,18 +1314,26 @@ class SystemMonitor:
         2. 等待监控线程结束（如果存在）
         3. 清理相关资源
 
-        注意：这个方法通常由监控方法内部调用（如KeyboardInterrupt），
+        注意：这个方法由 wait_monitoring() 在按下 Ctrl+C 时调用，
         也可以手动调用来停止监控。
         """
-        # 设置监控状态为False，停止监控循环
+        # 先记下监控线程是否在运行（唤醒后线程可能很快结束）
+        running = self.monitor_thread is not None and self.monitor_thread.is_alive()
+
+        # 设置监控状态为False，并唤醒正在等待的监控循环
         self.monitoring = False
+        self._stop_event.set()
 
-        # 如果存在监控线程且线程还在运行，等待线程结束
-        if self.monitor_thread and self.monitor_thread.is_alive():
+        # 如果监控线程还在运行，等待线程结束
+        if running:
             self.monitor_thread.join()
             print("监控已停止")
 
 
+# 程序退出时停止日志监听线程，确保队列中剩余的日志全部写出
+atexit.register(SystemMonitor._stop_log_listener)
+
+
 # =============================================================================
 # 向后兼容性函数接口
 #
@@ -903,6 +1372,7 @@ def monitor_cpu_usage(interval=1):
     """
     monitor = SystemMonitor()
     monitor.start_monitoring("cpu", interval=interval)
+    monitor.wait_monitoring()
 
 
 def monitor_memory_usage(interval=1):
@@ -919,6 +1389,7 @@ def monitor_memory_usage(interval=1):
     """
     monitor = SystemMonitor()
     monitor.start_monitoring("memory", interval=interval)
+    monitor.wait_monitoring()
 
 
 def monitor_network_speed(interval=1):
@@ -935,6 +1406,7 @@ def monitor_network_speed(interval=1):
     """
     monitor = SystemMonitor()
     monitor.start_monitoring("network", interval=interval)
+    monitor.wait_monitoring()
 
 
 def monitor_system_resources(interval=1):
@@ -951,6 +1423,7 @@ def monitor_system_resources(interval=1):
     """
     monitor = SystemMonitor()
     monitor.start_monitoring("system", interval=interval)
+    monitor.wait_monitoring()
 
 
 def monitor_running_applications(interval=5, top_n=10):
@@ -968,6 +1441,7 @@ def monitor_running_applications(interval=5, top_n=10):
     """
     monitor = SystemMonitor()
     monitor.start_monitoring("applications", interval=interval, top_n=top_n)
+    monitor.wait_monitoring()
 
 
 def get_detailed_process_info(pid=None):
@@ -991,33 +1465,15 @@ if __name__ == "__main__":
     主程序入口
 
     当直接运行此脚本时，会执行以下步骤：
-    1. 检查并安装必要的依赖
-    2. 创建SystemMonitor实例
-    3. 显示系统基本信息
-    4. 提供交互式菜单选择监控模式
-    5. 根据用户选择启动相应的监控功能
+    1. 创建SystemMonitor实例（依赖psutil在模块导入时已检查）
+    2. 显示系统基本信息
+    3. 提供交互式菜单选择监控模式
+    4. 根据用户选择启动相应的监控功能
 
     使用方法：
         python Tools.py
     """
 
-    # =============================================================================
-    # 依赖检查和安装
-    # =============================================================================
-    try:
-        # 尝试导入psutil库
-        import psutil
-    except ImportError:
-        # 如果psutil未安装，自动安装
-        print("正在安装必要的依赖库...")
-        import sys
-        import subprocess
-
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "psutil"])
-        import psutil
-
-        print("依赖库安装完成！")
-
     # =============================================================================
     # 创建监控器实例
     # =============================================================================
@@ -1068,18 +1524,23 @@ if __name__ == "__main__":
         elif choice == "1":
             print("启动CPU监控...")
             monitor.start_monitoring("cpu")
+            monitor.wait_monitoring()
         elif choice == "2":
             print("启动内存监控...")
             monitor.start_monitoring("memory")
+            monitor.wait_monitoring()
         elif choice == "3":
             print("启动系统资源综合监控...")
             monitor.start_monitoring("system")
+            monitor.wait_monitoring()
         elif choice == "4":
             print("启动网络速度监控...")
             monitor.start_monitoring("network")
+            monitor.wait_monitoring()
         elif choice == "5":
             print("启动应用程序监控...")
             monitor.start_monitoring("applications")
+            monitor.wait_monitoring()
         elif choice == "6":
             # 获取进程详细信息
             pid_input = input("请输入进程ID（直接回车显示所有进程）: ").strip()
@@ -1096,6 +1557,7 @@ if __name__ == "__main__":
         else:
             print("无效选择，默认启动CPU监控...")
             monitor.start_monitoring("cpu")
+            monitor.wait_monitoring()
 
     except KeyboardInterrupt:
         print("\n程序被用户中断")
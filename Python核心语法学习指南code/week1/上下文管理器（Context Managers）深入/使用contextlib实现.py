@@ -12,8 +12,16 @@ def performance_time(label):
         print(f"{label} 耗时: {end - start:.6f}秒")
 
 
+N = 100000000
+
+# 逐个累加：解释器执行N次循环，每次都要创建新的int对象
 with performance_time("大型计算任务"):
     total = 0
-    for i in range(100000000):
+    for i in range(N):
         total += i
     print(f"计算结果：{total}")
+
+# 同样的结果用等差数列求和公式（高斯求和）一步算出，耗时与N无关
+with performance_time("高斯求和"):
+    total = (N - 1) * N // 2
+    print(f"计算结果：{total}")
@@ -1,5 +1,6 @@
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # 银行账户类，演示线程安全的存取款操作
 class BankAccount:
@@ -16,11 +17,13 @@ class BankAccount:
             无
         说明：
             使用with语句自动加锁和释放锁，保证同一时刻只有一个线程能修改余额，防止数据竞争。
+            耗时的处理过程不涉及余额，放在锁外进行，持有锁的时间只包含读取和更新余额，
+            另一个线程不必在锁上等待这段处理时间。
         """
-        with self.lock:  # 加锁，进入临界区
+        time.sleep(0.1)  # 模拟存款处理时间（锁外进行）
+        with self.lock:  # 加锁，进入临界区：读取余额、计算和更新必须一起完成
             print(f"存款 {amount}, 当前余额: {self.balance}")
             new_balance = self.balance + amount  # 计算新余额
-            time.sleep(0.1)  # 模拟存款处理时间，便于观察并发问题
             self.balance = new_balance  # 更新余额
             # 释放锁（with语句块结束自动释放）
 
@@ -33,12 +36,13 @@ class BankAccount:
             实际取出的金额（int/float），如果余额不足则返回0。
         说明：
             取款操作也需要加锁，保证余额检查和扣减的原子性，防止并发下出现超取。
+            与存款一样，耗时的处理过程放在锁外，锁内只做余额检查和扣减。
         """
-        with self.lock:  # 加锁，进入临界区
+        time.sleep(0.1)  # 模拟取款处理时间（锁外进行）
+        with self.lock:  # 加锁，进入临界区：余额检查和扣减必须一起完成
             if self.balance >= amount:
                 print(f"取款 {amount}, 当前余额: {self.balance}")
                 new_balance = self.balance - amount  # 计算新余额
-                time.sleep(0.1)  # 模拟取款处理时间
                 self.balance = new_balance  # 更新余额
                 return amount  # 返回实际取出金额
             else:
@@ -69,23 +73,18 @@ account = BankAccount()
 operations1 = [200, -300, 500, -1000]  # 第一个用户的操作序列：存200，取300，存500，取1000
 operations2 = [100, -200, 300, -400]   # 第二个用户的操作序列：存100，取200，存300，取400
 
-# 创建两个线程对象，分别执行account_user函数
+# 用线程池提交两个用户的操作，池中的线程创建一次后可以被重复使用
 # 参数说明：
-#   target：线程要执行的目标函数
-#   args：传递给目标函数的参数（以元组形式）
-t1 = threading.Thread(target=account_user, args=(account, operations1))  # 线程1，执行operations1
-
-t2 = threading.Thread(target=account_user, args=(account, operations2))  # 线程2，执行operations2
-
-# 启动两个线程，开始并发执行
-# 线程启动后会异步执行account_user函数
+#   submit(函数, *参数)：把任务交给池中的线程执行，返回Future对象
 # 由于两个线程共享同一个BankAccount对象，必须依靠锁保证数据安全
-t1.start()
-t2.start()
-
-# 主线程等待两个子线程执行完毕（即所有操作完成）
-t1.join()
-t2.join()
+with ThreadPoolExecutor(max_workers=2) as executor:
+    futures = [
+        executor.submit(account_user, account, operations1),  # 线程1，执行operations1
+        executor.submit(account_user, account, operations2),  # 线程2，执行operations2
+    ]
+    # 等待两个任务执行完毕（即所有操作完成），任务中的异常会在这里重新抛出
+    for future in futures:
+        future.result()
 
 # 输出最终余额，验证多线程下数据是否正确
 print(f"最终余额: {account.balance}")
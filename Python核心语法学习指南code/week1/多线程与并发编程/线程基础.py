@@ -1,5 +1,5 @@
-import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 
 def worker(task_id, delay):
@@ -18,19 +18,14 @@ def worker(task_id, delay):
     print(f"任务 {task_id} 完成 (耗时 {delay}秒)")
 
 
-# 创建并启动线程
-threads = []  # 用于保存所有线程对象的列表
-for i in range(1, 6):  # 循环5次，创建5个线程
-    # 创建线程对象
-    # target: 线程要执行的目标函数
-    # args: 传递给目标函数的参数（以元组形式）
-    t = threading.Thread(target=worker, args=(i, i * 0.5))
-    t.start()  # 启动线程，线程开始执行worker函数
-    threads.append(t)  # 将线程对象保存到列表，便于后续管理
+# 用线程池执行任务：线程创建一次后被重复使用，不必为每个任务新建、销毁线程
+# max_workers: 线程池中最多同时运行的线程数，5个任务各占一个线程，与逐个创建线程时的并发度相同
+with ThreadPoolExecutor(max_workers=5) as executor:
+    task_ids = range(1, 6)  # 任务编号1~5
+    delays = [i * 0.5 for i in task_ids]  # 每个任务的耗时
+    # map 按顺序把 (任务编号, 耗时) 分发给池中的线程执行worker函数；
+    # list() 取出全部结果，任务中抛出的异常也会在这里重新抛出
+    list(executor.map(worker, task_ids, delays))
+    # 离开with语句块时会等待所有任务完成并关闭线程池（相当于逐个join）
 
-# 等待所有线程完成
-for t in threads:
-    t.join()  # 主线程阻塞，直到每个子线程执行完毕
-
-# print(threads)  # 可选：打印所有线程对象
-print("所有任务完成")  # 所有线程结束后输出
+print("所有任务完成")  # 所有任务结束后输出
@@ -1,9 +1,12 @@
 import concurrent
+import random
+import threading
+from collections import OrderedDict, deque
 from contextlib import contextmanager
 
 import requests
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from Python核心语法学习指南code.week1.通用日志处理模块.日志配置类 import LoggerFactory
 
@@ -14,54 +17,120 @@ logger = LoggerFactory.get_logger("api_client", {
 })
 
 
+def _freeze(value):
+    """
+    把请求参数/请求头转成可以作为字典键的形式：字典转为frozenset，列表、元组转为元组（保持顺序），
+    例如 {"id": [1, 2]} -> frozenset({("id", (1, 2))})。
+    """
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 class APIClient:
     """
     API客户端类，支持带日志、异常处理、重试、速率限制和并发请求。
     """
-    def __init__(self, base_url, max_retries=3, timeout=5):
+    def __init__(self, base_url, max_retries=3, timeout=5, max_requests=5, per_second=1, cache_ttl=30,
+                 cache_size=256):
         """
         初始化APIClient实例。
         参数：
             base_url (str): API基础URL。
             max_retries (int): 请求失败时的最大重试次数。
             timeout (int/float): 每次请求的超时时间（秒）。
+            max_requests (int): 速率限制：每个时间窗口内允许的最大请求数，同时也是并发线程数。
+            per_second (float): 速率限制的时间窗口长度（秒）。
+            cache_ttl (float): GET响应的缓存有效期（秒），为0时不缓存。
+            cache_size (int): 最多缓存的GET响应数，超出时淘汰最早缓存的响应。
         属性：
             session (requests.Session): 复用的HTTP会话对象，自动带上通用请求头。
+            _executor (ThreadPoolExecutor): 复用的线程池，线程数与速率限制一致，
+                多次调用get_users时不必重新创建线程。
+            _request_times (deque): 最近一个时间窗口内各请求的发出时刻（滑动窗口限速），
+                由_rate_lock保护，所有线程共用。
+            _response_cache (OrderedDict): GET响应缓存，(方法, URL, 参数, 请求头) -> (缓存时刻, JSON数据)，
+                按缓存时刻先后排列；有效期相同，最前面的总是最先过期，写入时从前面清理过期项。
+            _inflight (dict): 正在进行中的GET请求，同一个键 -> Future；相同请求并发到达时
+                只发出一次，其余调用等待同一个结果。两者都由_cache_lock保护。
         """
         self.base_url = base_url
         self.max_retries = max_retries
         self.timeout = timeout
+        self.max_requests = max_requests
+        self.per_second = per_second
+        self._executor = ThreadPoolExecutor(max_workers=max_requests)
+        self._request_times = deque()
+        self._rate_lock = threading.Lock()
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._response_cache = OrderedDict()
+        self._inflight = {}
+        self._cache_lock = threading.Lock()
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "APIClient/1.0",
             "Accept": "application/json"
         })
 
+    def close(self):
+        """
+        关闭线程池和HTTP会话，释放资源。
+        """
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+    def __enter__(self):
+        """
+        支持with语句：with APIClient(...) as client: ...
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        离开with语句块时自动关闭客户端。
+        """
+        self.close()
+
     @contextmanager
-    def rate_limiter(self, max_requests=5, per_second=1):
+    def rate_limiter(self, max_requests=None, per_second=None):
         """
         API速率限制的上下文管理器。
         参数：
-            max_requests (int): 每个时间窗口内允许的最大请求数。
-            per_second (float): 时间窗口长度（秒）。
+            max_requests (int): 每个时间窗口内允许的最大请求数，默认使用初始化时的配置。
+            per_second (float): 时间窗口长度（秒），默认使用初始化时的配置。
         用法：
-            with client.rate_limiter():
-                ...
+            with client.rate_limiter() as make_request:
+                make_request("users/123")
+        说明：
+            滑动窗口限速：记录最近per_second秒内每个请求的发出时刻，已满max_requests个时
+            等到最早的一个移出窗口再发出。窗口随时间持续滑动，不会只在第一个窗口内生效；
+            记录由同一个客户端的所有线程共用，并发请求也受同一个限制。
         """
-        start_time = time.time()  # 记录窗口起始时间
-        request_count = 0         # 当前窗口内的请求计数
+        if max_requests is None:
+            max_requests = self.max_requests
+        if per_second is None:
+            per_second = self.per_second
+        request_times = self._request_times
 
         def make_request(endpoint, **kwargs):
-            nonlocal request_count
-
-            # 检查速率限制
-            elapsed = time.time() - start_time
-            if request_count >= max_requests and elapsed < per_second:
-                sleep_time = per_second - elapsed
-                logger.warning(f"达到速率限制，等待 {sleep_time:.2f}秒")
-                time.sleep(sleep_time)
+            # 检查速率限制（加锁：多个线程依次占用窗口中的名额）
+            with self._rate_lock:
+                now = time.monotonic()
+                # 移除已经滑出时间窗口的请求记录
+                while request_times and now - request_times[0] >= per_second:
+                    request_times.popleft()
+                if len(request_times) >= max_requests:
+                    sleep_time = per_second - (now - request_times[-max_requests])
+                    logger.warning(f"达到速率限制，等待 {sleep_time:.2f}秒")
+                    time.sleep(sleep_time)
+                    now = time.monotonic()
+                    while request_times and now - request_times[0] >= per_second:
+                        request_times.popleft()
+                request_times.append(now)
 
-            request_count += 1
             return self._request(endpoint, **kwargs)
 
         yield make_request  # 作为上下文管理器的返回值
@@ -76,13 +145,83 @@ class APIClient:
             data (dict): 请求体数据（自动转为JSON）。
             headers (dict): 额外请求头。
         返回值：
-            dict: 响应的JSON数据。
+            dict: 响应的JSON数据。GET请求的结果会缓存cache_ttl秒，缓存期内返回同一个对象，调用方不应修改。
         异常：
             请求失败且重试用尽时抛出异常。
         """
         url = f"{self.base_url}/{endpoint}"  # 拼接完整URL
-        full_headers = {**self.session.headers, **(headers or {})}  # 合并请求头
 
+        # 只缓存GET请求（幂等，不带请求体）
+        if method != "GET" or data is not None or self.cache_ttl <= 0:
+            return self._send(url, method, params, data, headers)
+
+        try:
+            key = (method, url, _freeze(params), _freeze(headers))
+            hash(key)
+        except TypeError:
+            # 参数中有无法作为字典键的值（如集合），这次请求不走缓存
+            return self._send(url, method, params, data, headers)
+
+        with self._cache_lock:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                if time.monotonic() - cached[0] < self.cache_ttl:
+                    logger.debug(f"命中缓存: {method} {url}")
+                    return cached[1]
+                del self._response_cache[key]  # 已过期
+            # 相同请求正在进行中时等待它的结果，否则由本次调用发出请求
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = self._send(url, method, params, data, headers)
+        except BaseException as e:
+            # 请求失败不缓存，等待中的调用收到同样的异常
+            with self._cache_lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+
+        with self._cache_lock:
+            self._store(key, result)
+            del self._inflight[key]
+        future.set_result(result)
+        return result
+
+    def _store(self, key, result):
+        """
+        写入一条GET响应缓存（调用方持有_cache_lock）。
+        先从最前面清理已过期的项，仍超过cache_size时淘汰最早缓存的项，缓存大小始终有上限。
+        """
+        cache = self._response_cache
+        now = time.monotonic()
+        while cache:
+            oldest_key, (cached_at, _) = next(iter(cache.items()))
+            if now - cached_at < self.cache_ttl:
+                break
+            del cache[oldest_key]
+        cache.pop(key, None)  # 重新写入的键移到最后，保持按缓存时刻排列
+        cache[key] = (now, result)
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    def _send(self, url, method, params, data, headers):
+        """
+        发出HTTP请求，失败时按去相关抖动（decorrelated jitter）退避重试：
+        每次等待时间在 [1, 上次等待时间*3] 中随机选取，最长30秒，
+        避免大量并发请求同时失败后按相同节奏一起重试。
+        参数：
+            url (str): 完整URL。
+            其余参数同_request。
+        返回值：
+            dict: 响应的JSON数据。
+        """
+        prev_sleep = 1  # 上一次重试的等待时间（秒）
         for attempt in range(self.max_retries + 1):  # 支持重试
             try:
                 logger.debug(f"请求: {method} {url} (尝试 {attempt + 1})")
@@ -91,7 +230,7 @@ class APIClient:
                     url,
                     params=params,
                     json=data,
-                    headers=full_headers,
+                    headers=headers,  # 只传本次请求的额外请求头，由Session与默认请求头合并
                     timeout=self.timeout
                 )
 
@@ -101,8 +240,10 @@ class APIClient:
 
             except requests.exceptions.RequestException as e:
                 if attempt < self.max_retries:
-                    sleep_time = 2 ** attempt  # 指数退避，逐次延长等待时间
-                    logger.warning(f"请求失败: {e}, {attempt + 1}/{self.max_retries}次重试, 等待 {sleep_time}秒")
+                    # 去相关抖动：等待时间随机化，各线程的重试时刻错开
+                    sleep_time = min(30, random.uniform(1, prev_sleep * 3))
+                    prev_sleep = sleep_time
+                    logger.warning(f"请求失败: {e}, {attempt + 1}/{self.max_retries}次重试, 等待 {sleep_time:.2f}秒")
                     time.sleep(sleep_time)
                 else:
                     logger.error(f"请求失败: {method} {url} - {e}")
@@ -116,31 +257,42 @@ class APIClient:
         返回值：
             dict: 用户ID到用户信息的映射，失败时为{"error": ...}。
         说明：
-            使用线程池并发请求，自动处理异常和日志。
+            使用实例复用的线程池并发请求（线程数等于max_requests，不会一次发出超过速率限制的请求），
+            自动处理异常和日志。同一时刻最多只有 2*max_requests 个请求已提交未完成，
+            每完成一批再补充提交，用户ID很多时也不会一次创建全部Future。
         """
-        with ThreadPoolExecutor() as executor, self.rate_limiter():
-            # 提交所有用户请求到线程池
-            futures = {
-                executor.submit(self._request, f"users/{user_id}"): user_id
-                for user_id in user_ids
-            }
+        executor = self._executor
+        window = 2 * self.max_requests  # 已提交未完成的请求数上限
+        ids = iter(user_ids)
+        results = {}
+        with self.rate_limiter() as make_request:
+            # 每个请求都经过速率限制；pending 记录已提交未完成的 future -> 用户ID
+            pending = {}
+            while True:
+                # 补充提交，直到窗口填满或没有剩余的用户ID
+                for user_id in ids:
+                    pending[executor.submit(make_request, f"users/{user_id}")] = user_id
+                    if len(pending) >= window:
+                        break
+                if not pending:
+                    break
 
-            results = {}
-            # as_completed会在每个future完成时返回
-            for future in concurrent.futures.as_completed(futures):
-                user_id = futures[future]
-                try:
-                    results[user_id] = future.result()  # 获取请求结果
-                except Exception as e:
-                    logger.exception(f"获取用户 {user_id} 失败")
-                    results[user_id] = {"error": str(e)}  # 记录错误信息
+                # 等到至少一个请求完成
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    user_id = pending.pop(future)
+                    try:
+                        results[user_id] = future.result()  # 获取请求结果
+                    except Exception as e:
+                        logger.exception(f"获取用户 {user_id} 失败")
+                        results[user_id] = {"error": str(e)}  # 记录错误信息
 
-            return results
+        return results
 
 
 # 使用示例
 if __name__ == "__main__":
-    client = APIClient("https://api.example.com")  # 创建API客户端实例
+    client = APIClient("https://api.example.com")  # 创建API客户端实例，用完后调用close()释放线程池
 
     # 单请求示例
     try:
@@ -154,4 +306,6 @@ if __name__ == "__main__":
         users = client.get_users([123, 456, 789, 101])  # 并发获取多个用户
         logger.info(f"获取的用户: {list(users.keys())}")
     except Exception:
-        logger.error("批量获取用户失败")
\ No newline at end of file
+        logger.error("批量获取用户失败")
+    finally:
+        client.close()
\ No newline at end of file
@@ -48,9 +48,17 @@ class TimerDecorator:
     装饰器堆叠与顺序
     """
 
+    # 固定实例属性，不创建__dict__；functools.update_wrapper需要写__doc__和__dict__，
+    # 与__slots__冲突，因此只手动保留__name__和__wrapped__
+    __slots__ = ('func', '__name__', '__wrapped__', '_sum', '_count')
+
     def __init__(self, func):
         self.func = func
-        self.times = []
+        self.__name__ = func.__name__
+        self.__wrapped__ = func
+        # 只记录累计耗时和调用次数，平均值O(1)算出，不保存每次的耗时
+        self._sum = 0.0
+        self._count = 0
 
     def __call__(self, *args, **kwargs):
         import time
@@ -58,10 +66,11 @@ class TimerDecorator:
         result = self.func(*args, **kwargs)
         end = time.perf_counter()
         elapsed = end - start
-        self.times.append(elapsed)
+        self._sum += elapsed
+        self._count += 1
 
-        print(f"{self.func.__name__} 执行时间: {elapsed:.6f}秒")
-        print(f"平均执行时间: {sum(self.times) / len(self.times):.6f}秒")
+        print(f"{self.__name__} 执行时间: {elapsed:.6f}秒")
+        print(f"平均执行时间: {self._sum / self._count:.6f}秒")
         return result
 
 
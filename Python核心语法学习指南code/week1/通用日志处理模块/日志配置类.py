@@ -37,7 +37,8 @@ class LoggerFactory:
             "max_bytes": 10 * 1024 * 1024,     # 单文件最大10MB，超出后轮转
             "backup_count": 7,                 # 最多保留7个备份
             "when": "midnight",               # 时间轮转单位，默认每天0点
-            "interval": 1                      # 时间轮转间隔，默认1天
+            "interval": 1,                     # 时间轮转间隔，默认1天
+            "rotation": "size"                 # 轮转方式：size/time/both，默认只按大小轮转
         }
 
         # 合并自定义配置（如有）
@@ -55,7 +56,8 @@ class LoggerFactory:
             max_bytes=default_config["max_bytes"],
             backup_count=default_config["backup_count"],
             when=default_config["when"],
-            interval=default_config["interval"]
+            interval=default_config["interval"],
+            rotation=default_config["rotation"]
         )
 
         cls._loggers[name] = logger  # 缓存logger对象，便于复用
@@ -2,6 +2,104 @@ import logging
 from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
 import os
 import sys
+import threading
+
+
+class BufferedFileMixin:
+    """
+    文件日志处理器的缓冲写入混入类。
+    说明：
+        标准FileHandler每写一条记录就flush一次，每条日志都是一次write系统调用。
+        这里给文件流设置大缓冲区（默认1MB），emit只把记录写入内存缓冲区，由后台线程每隔flush_interval秒
+        调用flush写入文件一次；ERROR及以上级别的记录立即写入，显式调用flush或关闭处理器时写入剩余内容。
+        只用于轮转文件处理器（BaseRotatingHandler的子类）。
+    """
+
+    def __init__(self, *args, buffer_size=1 << 20, flush_interval=1.0, **kwargs):
+        self.buffer_size = buffer_size  # 必须在父类__init__打开文件之前设置
+        self.flush_interval = flush_interval
+        super().__init__(*args, **kwargs)
+        self._closing = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name=f"log-flusher-{self.baseFilename}",
+                                         daemon=True)
+        self._flusher.start()
+
+    def _open(self):
+        # 以大缓冲区打开日志文件，缓冲区写满后才真正写入磁盘
+        return open(self.baseFilename, self.mode, encoding=self.encoding, errors=self.errors,
+                    buffering=self.buffer_size)
+
+    def emit(self, record):
+        # 与BaseRotatingHandler.emit相同，只是写入后不调用flush，记录留在缓冲区中
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()  # 错误日志立即写入，程序随后崩溃也不会丢失
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _flush_loop(self):
+        # 后台线程：每隔flush_interval秒写入一次，处理器关闭时退出
+        while not self._closing.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        self._closing.set()
+        super().close()  # 关闭文件流时会写入缓冲区中剩余的内容
+
+
+class BufferedRotatingFileHandler(BufferedFileMixin, RotatingFileHandler):
+    """
+    带缓冲区的按大小轮转文件处理器。
+    说明：
+        标准RotatingFileHandler每条记录都要seek到文件末尾取文件大小，seek会把缓冲区强制写出，
+        这里改为自己累计已写入的字节数判断是否需要轮转。
+    """
+
+    _pending = 0  # 当前这条记录编码后的字节数
+
+    def _open(self):
+        stream = super()._open()
+        self._size = stream.seek(0, 2)  # 打开时的文件大小（追加模式下即文件末尾位置）
+        return stream
+
+    def shouldRollover(self, record):
+        if self.stream is None:  # delay=True时首次写入才打开文件
+            self.stream = self._open()
+        if self.maxBytes > 0:
+            # 按文件实际使用的编码计算字节数（中文在UTF-8下一个字占3字节，不能按字符数算）
+            msg = "%s\n" % self.format(record)
+            self._pending = len(msg.encode(self.stream.encoding, self.stream.errors or "strict"))
+            if self._size + self._pending >= self.maxBytes:
+                return True
+            self._size += self._pending
+        return False
+
+    def doRollover(self):
+        super().doRollover()
+        self._size += self._pending  # 触发轮转的这条记录写入新文件
+
+
+class BufferedTimedRotatingFileHandler(BufferedFileMixin, TimedRotatingFileHandler):
+    """
+    带缓冲区的按时间轮转文件处理器。
+    """
+
+
+# 默认日志格式化器：时间-名称-级别-文件:行号-消息，所有日志记录器共用
+_DEFAULT_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - "
+    "%(filename)s:%(lineno)d - %(message)s"
+)
+
+# 已配置的日志记录器：名称 -> (配置参数, logger)，相同配置重复调用时直接返回
+_configured = {}
 
 
 def setup_logger(name="app",
@@ -11,7 +109,10 @@ def setup_logger(name="app",
                  backup_count=5,
                  when="midnight",
                  interval=1,
-                 formatter=None):
+                 formatter=None,
+                 buffer_size=1 << 20,  # 1MB
+                 flush_interval=1.0,
+                 rotation="size"):
     """
     配置并返回一个高级日志记录器。
     参数：
@@ -23,15 +124,30 @@ def setup_logger(name="app",
         when (str): 时间轮转的单位（如'midnight'、'D'、'H'等，适用于时间轮转）。
         interval (int): 时间轮转的间隔数。
         formatter (logging.Formatter): 日志格式化器对象，若为None则使用默认格式。
+        buffer_size (int): 日志文件的写缓冲区大小（字节）。
+        flush_interval (float): 缓冲区内容写入文件的时间间隔（秒），ERROR及以上级别立即写入。
+        rotation (str): 轮转方式："size"按文件大小轮转（写log_file），"time"按时间轮转（写log_file + ".timed"），
+            "both"两个文件都写（每条日志写两次，只在确实需要两种轮转时使用）。
     返回值：
         logger (logging.Logger): 配置好的日志记录器对象。
     说明：
         支持文件大小轮转、时间轮转、控制台输出等多种日志处理方式。
+        同名、同配置重复调用时直接返回已配置好的日志记录器，不再重建处理器；
+        配置不同时关闭旧处理器并按新配置重新创建。
     """
-    # 创建日志文件目录（如果需要）
+    if rotation not in ("size", "time", "both"):
+        raise ValueError(f"不支持的轮转方式: {rotation}，可选值为 size、time、both")
+
+    key = (log_file, level, max_bytes, backup_count, when, interval, formatter,
+           buffer_size, flush_interval, rotation)
+    cached = _configured.get(name)
+    if cached is not None and cached[0] == key and cached[1].handlers:
+        return cached[1]
+
+    # 创建日志文件目录（如果需要），目录已存在时不报错
     log_dir = os.path.dirname(log_file)
-    if log_dir and not os.path.exists(log_dir):
-        os.makedirs(log_dir)  # 自动创建日志目录，避免因目录不存在导致报错
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)  # 自动创建日志目录，避免因目录不存在导致报错
 
     # 创建日志记录器对象（同名只会创建一个实例）
     logger = logging.getLogger(name)
@@ -39,31 +155,35 @@ def setup_logger(name="app",
 
     # 防止日志重复记录（清空已存在的处理器）
     if logger.hasHandlers():
+        for handler in logger.handlers:
+            handler.close()  # 先关闭旧处理器，写入缓冲区中的日志并停止后台线程
         logger.handlers.clear()
 
     # 设置日志格式化器
     if formatter is None:
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - "
-            "%(filename)s:%(lineno)d - %(message)s"
-        )  # 默认格式：时间-名称-级别-文件:行号-消息
+        formatter = _DEFAULT_FORMATTER
 
     # 文件处理器1：按文件大小轮转
-    file_handler = RotatingFileHandler(
-        log_file, maxBytes=max_bytes, backupCount=backup_count
-    )
-    file_handler.setFormatter(formatter)  # 设置格式
-    logger.addHandler(file_handler)  # 添加到日志记录器
+    if rotation in ("size", "both"):
+        file_handler = BufferedRotatingFileHandler(
+            log_file, maxBytes=max_bytes, backupCount=backup_count,
+            buffer_size=buffer_size, flush_interval=flush_interval
+        )
+        file_handler.setFormatter(formatter)  # 设置格式
+        logger.addHandler(file_handler)  # 添加到日志记录器
 
     # 文件处理器2：按时间轮转（如每天0点新建日志文件）
-    time_handler = TimedRotatingFileHandler(
-        log_file + ".timed",  # 时间轮转日志文件名
-        when=when,             # 轮转单位
-        interval=interval,     # 轮转间隔
-        backupCount=backup_count  # 备份数量
-    )
-    time_handler.setFormatter(formatter)
-    logger.addHandler(time_handler)
+    if rotation in ("time", "both"):
+        time_handler = BufferedTimedRotatingFileHandler(
+            log_file + ".timed",  # 时间轮转日志文件名
+            when=when,             # 轮转单位
+            interval=interval,     # 轮转间隔
+            backupCount=backup_count,  # 备份数量
+            buffer_size=buffer_size,
+            flush_interval=flush_interval
+        )
+        time_handler.setFormatter(formatter)  # 与大小轮转共用同一个格式化器
+        logger.addHandler(time_handler)
 
     # 控制台处理器：输出到标准输出（如终端/控制台）
     console_handler = logging.StreamHandler(sys.stdout)
@@ -76,6 +196,7 @@ def setup_logger(name="app",
     #     mail_handler.setLevel(logging.ERROR)
     #     logger.addHandler(mail_handler)
 
+    _configured[name] = (key, logger)
     return logger  # 返回配置好的日志记录器
 
 
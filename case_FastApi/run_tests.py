@@ -1,4 +1,6 @@
 import os
+import subprocess
+import sys
 import time
 
 if __name__ == "__main__":
@@ -6,6 +8,14 @@ if __name__ == "__main__":
     report_dir = os.path.join(os.path.dirname(__file__), "reports")
     os.makedirs(report_dir, exist_ok=True)
     report_file = os.path.join(report_dir, f"report_{timestamp}.html")
-    exit_code = os.system(f'pytest --html="{report_file}" --self-contained-html')
+    # 用例耗时基本都在等待接口响应，用 pytest-xdist 按 CPU 核数开多个进程并发执行；
+    # loadfile 让同一个文件的用例在同一个进程中执行，模块级 fixture（如 repeat_email）保持一致，
+    # 会话级缓存（http、tokens 等）每个进程各自一份
+    # 直接以参数列表启动 pytest，不经过 shell 解析命令行，报告路径含空格也无需加引号
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-n", "auto", "--dist=loadfile",
+         f"--html={report_file}", "--self-contained-html"],
+        check=False,
+    )
     print(f"\n测试报告已生成: {report_file}")
-    exit(exit_code) 
\ No newline at end of file
+    exit(result.returncode) 
\ No newline at end of file
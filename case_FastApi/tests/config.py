@@ -1 +1,7 @@
-BASE_URL = "http://115.190.81.75:8000" 
\ No newline at end of file
+import os
+
+BASE_URL = "http://115.190.81.75:8000"
+
+# 项目根目录（case_FastApi）与用例数据目录，导入时计算一次
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, 'data')
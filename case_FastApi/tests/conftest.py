@@ -1,13 +1,118 @@
+import atexit
+import functools
 import os
 import logging
+import logging.handlers
+import queue
 
-log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs')
+import pytest
+import requests
+import yaml
+from requests.adapters import HTTPAdapter
+
+from tests.config import BASE_DIR, BASE_URL, DATA_DIR
+
+# 优先使用 libyaml 的 C 实现解析 YAML，未编译 libyaml 时退回纯 Python 的 SafeLoader
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+log_dir = os.path.join(BASE_DIR, 'logs')
 os.makedirs(log_dir, exist_ok=True)
 log_file = os.path.join(log_dir, 'all_tests.log')
 
-logging.basicConfig(
-    filename=log_file,
-    level=logging.INFO,
-    format='%(asctime)s %(levelname)s %(message)s',
-    encoding='utf-8'
-) 
\ No newline at end of file
+# 用例线程只把日志记录放入队列，由 QueueListener 的后台线程写文件，写日志不阻塞用例执行
+log_queue = queue.Queue(-1)
+file_handler = logging.FileHandler(log_file, encoding='utf-8')
+file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+log_listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+log_listener.start()
+# 进程退出前停止监听线程，队列中剩余的日志全部写入文件
+atexit.register(log_listener.stop)
+
+root_logger = logging.getLogger()
+root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+root_logger.setLevel(logging.INFO)
+
+
+@functools.lru_cache(maxsize=None)
+def load_test_data(filename):
+    # 读取 data 目录下的 YAML 用例数据，同一个文件整个会话只解析一次
+    data_path = os.path.join(DATA_DIR, filename)
+    with open(data_path, encoding='utf-8') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
+def pytest_generate_tests(metafunc):
+    # 按模块名找数据文件：test_login_token.py -> data/login_token.yaml
+    if "case" in metafunc.fixturenames:
+        module_name = metafunc.module.__name__.rsplit('.', 1)[-1]
+        cases = load_test_data(f"{module_name[len('test_'):]}.yaml")
+        metafunc.parametrize("case", cases, ids=case_ids(cases))
+
+
+def case_ids(cases):
+    # 收集时一次生成可读的用例 id（报告中直接看出是哪条用例）：
+    # 登录用例用 序号-用户名（同一用户名有多条用例，加序号区分；不能带密码，id 会出现在报告和 CI 日志中），
+    # 其余取 case_type 或 token_type，都没有时用序号
+    ids = []
+    for i, c in enumerate(cases):
+        if "username" in c:
+            ids.append(f"{i}-{c['username']}")
+        else:
+            ids.append(c.get("case_type") or c.get("token_type") or str(i))
+    return ids
+
+
+@pytest.fixture(scope="session")
+def http():
+    # 整个测试会话共用一个 Session，用例之间复用 TCP 连接（HTTP keep-alive），不再每个请求重新握手
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    yield session
+    session.close()
+
+
+def get_token(http, credentials):
+    # 登录获取 access_token，登录失败时返回空字符串
+    url = f"{BASE_URL}/api/v1/login/access-token"
+    response = http.post(url, data=credentials)
+    return response.json().get("access_token", "")
+
+
+def get_user_id(http, token):
+    # 通过 test-token 接口查询 token 对应的用户 id
+    url = f"{BASE_URL}/api/v1/login/test-token"
+    headers = {"Authorization": f"Bearer {token}"}
+    response = http.post(url, headers=headers)
+    return response.json().get("id", "")
+
+
+@pytest.fixture(scope="session")
+def tokens(http):
+    # 按账号缓存 access_token：同一账号整个会话只登录一次（服务端登录要校验密码哈希，开销大）
+    cache = {}
+
+    def _get(credentials):
+        key = (credentials["username"], credentials["password"])
+        if key not in cache:
+            cache[key] = get_token(http, credentials)
+        return cache[key]
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def user_ids(http):
+    # 按 token 缓存用户 id，同一个 token 只查询一次
+    cache = {}
+
+    def _get(token):
+        if token not in cache:
+            cache[token] = get_user_id(http, token)
+        return cache[token]
+
+    return _get
@@ -1,29 +1,24 @@
 import pytest
-import requests
-import yaml
 from tests.config import BASE_URL
-import os
+import itertools
 import time
 import random
 import logging
 
-def load_test_data():
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    data_path = os.path.join(base_dir, 'data', 'signup.yaml')
-    with open(data_path, encoding='utf-8') as f:
-        return yaml.safe_load(f)
+logger = logging.getLogger(__name__)
 
-test_data = load_test_data()
+# 前缀（时间戳+随机数）每个进程只生成一次，之后靠递增序号保证唯一
+_email_prefix = f"newuser_{int(time.time())}_{random.randint(1000,9999)}"
+_email_counter = itertools.count()
 
 def gen_unique_email():
-    return f"newuser_{int(time.time())}_{random.randint(1000,9999)}@ks.com"
+    return f"{_email_prefix}_{next(_email_counter)}@ks.com"
 
 @pytest.fixture(scope="module")
 def repeat_email():
     return gen_unique_email()
 
-@pytest.mark.parametrize("case", test_data)
-def test_signup(case, repeat_email):
+def test_signup(http, case, repeat_email):
     url = f"{BASE_URL}/api/v1/users/signup"
     email = case["email"]
     if email == "{unique}":
@@ -36,10 +31,10 @@ def test_signup(case, repeat_email):
     }
     if case["full_name"]:
         payload["full_name"] = case["full_name"]
-    response = requests.post(url, json=payload)
-    log_msg = f"signup: case_type={case['case_type']}, email={email}, status={response.status_code}, body={response.text}"
-    print(log_msg)
-    logging.info(log_msg)
+    response = http.post(url, json=payload)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("signup: case_type=%s, email=%s, status=%s, body=%s",
+                    case['case_type'], email, response.status_code, response.text)
     assert response.status_code == case["expected_status"]
     if case["expected_in_json"]:
         assert case["expected_in_json"] in response.json() 
\ No newline at end of file
@@ -1,53 +1,39 @@
-import pytest
 import requests
-import yaml
 from tests.config import BASE_URL
-import os
 import logging
 
+logger = logging.getLogger(__name__)
 
-def get_token():
-    url = f"{BASE_URL}/api/v1/login/access-token"
-    data = {
-        "username": "xiehaoliang@ks.com",
-        "password": "xiehaoliang"
-    }
-    response = requests.post(url, data=data)
-    return response.json().get("access_token", "")
 
+VALID_USER = {"username": "xiehaoliang@ks.com", "password": "xiehaoliang"}
 
-def load_test_data():
-    # 获取项目根目录（case_FastApi）
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    data_path = os.path.join(base_dir, 'data', 'token_validity.yaml')
-    with open(data_path, encoding='utf-8') as f:
-        return yaml.safe_load(f)
 
-
-test_data = load_test_data()
-
-
-@pytest.mark.parametrize("case", test_data)
-def test_token_validity(case):
+def test_token_validity(http, tokens, case):
     if case["token_type"] == "valid":
-        token = get_token()
+        token = tokens(VALID_USER)
     elif case["token_type"] == "invalid":
         token = "invalidtoken"
     else:
         token = ""
     url = f"{BASE_URL}/api/v1/login/test-token"
     headers = {"Authorization": f"Bearer {token}"} if token else {}
-    response = requests.post(url, headers=headers)
-    log_msg = f"token_validity: token_type={case['token_type']}, status={response.status_code}, body={response.text}"
-    print(log_msg)
-    logging.info(log_msg)
+    response = http.post(url, headers=headers)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("token_validity: token_type=%s, status=%s, body=%s",
+                    case['token_type'], response.status_code, response.text)
     assert response.status_code == case["expected_status"]
 
 
 if __name__ == "__main__":
+    from functools import partial
+    from tests.conftest import get_token, load_test_data
+
+    http = requests.Session()
+    tokens = partial(get_token, http)
+    test_data = load_test_data("token_validity.yaml")
     for case in test_data:
         try:
-            test_token_validity(case)
+            test_token_validity(http, tokens, case)
             print(f"[PASS] token_type={case['token_type']}")
         except AssertionError as e:
             print(f"[FAIL] token_type={case['token_type']} -> {e}")